@@ -33,21 +33,59 @@ Usage:
 
 """
 
+from typing import Optional
+
 from src.core import AstNode, Assign, ExprStmt, Return, Identifier, Subscript
 from .expr_generator import ExprGenerator
 from .scope_manager import ScopeManager
 
+# Augmented assignment operator -> underlying binary operator
+_AUGMENTED_OPS = {
+    "+=": "+",
+    "-=": "-",
+    "*=": "*",
+    "/=": "/",
+    "//=": "//",
+    "%=": "%",
+    "**=": "**",
+}
+
+
+def _augmented_assign(target: str, op: str, rhs_code: str, context: str = "") -> str:
+    """
+    Generate `target = target <op> value` for an augmented assignment.
+    `context` is appended to the error message for unsupported operators.
+    """
+    base_op = _AUGMENTED_OPS.get(op)
+    if base_op is None:
+        raise NotImplementedError(
+            f"Augmented assignment operator '{op}' not supported{context}"
+        )
+    # Special cases for operations that need method calls
+    if base_op == "//":
+        # x //= y  ->  x = x.floor_div(y)
+        return f"{target} = ({target}).floor_div({rhs_code});"
+    if base_op == "**":
+        # x **= y  ->  x = x.pow(y)
+        return f"{target} = ({target}).pow({rhs_code});"
+    # Standard operators: x += y  ->  x = x + y
+    return f"{target} = ({target}) {base_op} ({rhs_code});"
+
 
 class BasicStatementGenerator:
 
-    def __init__(self, scope: ScopeManager):
+    def __init__(self, scope: ScopeManager, expr_generator: Optional[ExprGenerator] = None):
         """
         Initialize the BasicStatementGenerator.
         Args:
             scope (ScopeManager): Scope manager for tracking variable declarations.
+            expr_generator (ExprGenerator, optional): Shared expression generator;
+                a private one is created when omitted.
         """
         self.scope = scope
-        self.expr = ExprGenerator(scope=self.scope)
+        if expr_generator is None:
+            expr_generator = ExprGenerator(scope=self.scope)
+        self.expr = expr_generator
 
     def visit(self, node: AstNode) -> str:
         """
@@ -61,12 +99,13 @@ class BasicStatementGenerator:
         Raises:
             NotImplementedError: If the node type is not supported.
         """
-        method = getattr(self, f"visit_{type(node).__name__}", None)
-        if not method or not callable(method):
+        try:
+            visitor = self._VISITORS[type(node)]
+        except KeyError:
             raise NotImplementedError(
                 f"BasicStatementGenerator does not support node type {type(node).__name__}"
-            )
-        return method(node)
+            ) from None
+        return visitor(self, node)
 
     # ---------- Assignment Statements ----------
     def visit_Assign(self, node: Assign) -> str:
@@ -102,33 +141,7 @@ class BasicStatementGenerator:
                     f"Variable '{name}' used before declaration in augmented assignment"
                 )
 
-            augmented_ops = {
-                "+=": "+",
-                "-=": "-",
-                "*=": "*",
-                "/=": "/",
-                "//=": "//",
-                "%=": "%",
-                "**=": "**",
-            }
-
-            if op not in augmented_ops:
-                raise NotImplementedError(
-                    f"Augmented assignment operator '{op}' not supported"
-                )
-
-            base_op = augmented_ops[op]
-
-            # Generate: x = x op value
-            # Special cases for operations that need method calls
-            if base_op == "//":
-                # x //= y  ->  x = x.floor_div(y)
-                return f"{name} = ({name}).floor_div({rhs_code});"
-            if base_op == "**":
-                # x **= y  ->  x = x.pow(y)
-                return f"{name} = ({name}).pow({rhs_code});"
-            # Standard operators: x += y  ->  x = x + y
-            return f"{name} = ({name}) {base_op} ({rhs_code});"
+            return _augmented_assign(name, op, rhs_code)
 
         # Handle subscript assignment (e.g., arr[i] = value)
         elif isinstance(node.target, Subscript):
@@ -138,32 +151,8 @@ class BasicStatementGenerator:
             if op == "=":
                 # Simple subscript assignment: arr[i] = value
                 return f"{lhs_code} = {rhs_code};"
-            else:
-                # Augmented subscript assignment: arr[i] += value
-                augmented_ops = {
-                    "+=": "+",
-                    "-=": "-",
-                    "*=": "*",
-                    "/=": "/",
-                    "//=": "//",
-                    "%=": "%",
-                    "**=": "**",
-                }
-
-                if op not in augmented_ops:
-                    raise NotImplementedError(
-                        f"Augmented assignment operator '{op}' not supported for subscripts"
-                    )
-
-                base_op = augmented_ops[op]
-
-                # Special handling for floor division and power
-                if base_op == "//":
-                    return f"{lhs_code} = ({lhs_code}).floor_div({rhs_code});"
-                elif base_op == "**":
-                    return f"{lhs_code} = ({lhs_code}).pow({rhs_code});"
-                else:
-                    return f"{lhs_code} = ({lhs_code}) {base_op} ({rhs_code});"
+            # Augmented subscript assignment: arr[i] += value
+            return _augmented_assign(lhs_code, op, rhs_code, " for subscripts")
 
         # Invalid assignment target
         else:
@@ -181,7 +170,7 @@ class BasicStatementGenerator:
             str: C++ expression code terminated with semicolon.
         """
         # Special handling for import statements - ignore them
-        if hasattr(node.value, "name") and node.value.name in ["import", "sys"]:
+        if getattr(node.value, "name", None) in ("import", "sys"):
             return ""  # Skip import/sys identifier statements
 
         code = self.expr.visit(node.value)
@@ -199,3 +188,11 @@ class BasicStatementGenerator:
         if node.value is None:
             return "return DynamicType();"
         return f"return {self.expr.visit(node.value)};"
+
+
+# Statement class -> visitor function, built once for all instances
+BasicStatementGenerator._VISITORS = {
+    Assign: BasicStatementGenerator.visit_Assign,
+    ExprStmt: BasicStatementGenerator.visit_ExprStmt,
+    Return: BasicStatementGenerator.visit_Return,
+}
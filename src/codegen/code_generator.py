@@ -5,8 +5,14 @@ Integrates expression, statement, function, and data structure generators
 to produce complete C++ programs with DynamicType support.
 """
 
-from typing import List
-from .statement_generator import StatementVisitor
+import os
+from typing import Iterator, List
+from .statement_generator import (
+    BASIC_STATEMENTS,
+    CONTROL_STATEMENTS,
+    StatementVisitor,
+    indent_lines,
+)
 from .data_structure_generator import DataStructureGenerator
 from .expr_generator import ExprGenerator
 from .function_generator import FunctionGenerator
@@ -14,15 +20,24 @@ from .basic_statement_generator import BasicStatementGenerator
 from .scope_manager import ScopeManager
 from src.core import (
     AstNode,
+    BinaryExpr,
+    CallExpr,
+    Identifier,
+    LiteralExpr,
     Module,
     FunctionDef,
-    Block,
-    If,
-    While,
-    For,
-    Assign,
-    ExprStmt,
-    Return,
+    UnaryExpr,
+)
+from src.core.ast import ComparisonExpr, DictExpr, ListExpr, SetExpr, TupleExpr
+
+_DATA_STRUCTURE_NODES = (ListExpr, TupleExpr, SetExpr, DictExpr)
+_EXPRESSION_NODES = (
+    LiteralExpr,
+    Identifier,
+    UnaryExpr,
+    BinaryExpr,
+    ComparisonExpr,
+    CallExpr,
 )
 
 
@@ -34,6 +49,9 @@ using namespace std;
 class CodeGenerator:
     """Main code generation orchestrator."""
 
+    # Node class -> name of the generator attribute that handles it
+    _routes = {}
+
     def __init__(self):
         self.scope = ScopeManager()
 
@@ -42,13 +60,21 @@ class CodeGenerator:
             expr_generator=self.expr_generator
         )
         self.expr_generator.data_structure_generator = self.data_structure_generator
-        self.basic_stmt_generator = BasicStatementGenerator(scope=self.scope)
+        # One expression generator (with the data structure generator attached)
+        # is shared by every statement and function generator
+        self.basic_stmt_generator = BasicStatementGenerator(
+            scope=self.scope, expr_generator=self.expr_generator
+        )
         self.statement_visitor = StatementVisitor(
             expr_generator=self.expr_generator,
             scope_manager=self.scope,
             basic_stmt_generator=self.basic_stmt_generator,
         )
-        self.function_generator = FunctionGenerator(self.scope)
+        self.function_generator = FunctionGenerator(
+            self.scope,
+            expr_generator=self.expr_generator,
+            basic_stmt_generator=self.basic_stmt_generator,
+        )
 
     def visit(self, node) -> str:
         """
@@ -58,25 +84,31 @@ class CodeGenerator:
         Returns:
                 str: Generated code for the node.
         """
-        node_type = node.__class__.__name__
-
-        # Handle expressions and identifiers
-        if node_type.endswith("Expr") or node_type == "Identifier":
-            # Check if it's a data structure expression first
-            if node_type in ["ListExpr", "TupleExpr", "SetExpr", "DictExpr"]:
-                return self.data_structure_generator.visit(node)
-            return self.expr_generator.visit(node)
+        cls = type(node)
+        route = self._routes.get(cls)
+        if route is None:
+            route = self._routes[cls] = self._route_for(cls)
+        return getattr(self, route).visit(node)
+
+    @staticmethod
+    def _route_for(cls) -> str:
+        """Name of the generator attribute that handles a node class."""
+        # Data structure expressions first, then the remaining expressions
+        if issubclass(cls, _DATA_STRUCTURE_NODES):
+            return "data_structure_generator"
+        if issubclass(cls, _EXPRESSION_NODES):
+            return "expr_generator"
 
         # Handle function definitions
-        if node_type == "FunctionDef":
-            return self.function_generator.visit(node)
+        if issubclass(cls, FunctionDef):
+            return "function_generator"
 
         # Handle basic statements separately from control flow
-        if node_type in ["Assign", "ExprStmt", "Return"]:
-            return self.basic_stmt_generator.visit(node)
+        if issubclass(cls, BASIC_STATEMENTS):
+            return "basic_stmt_generator"
 
         # Handle control flow and other statements
-        return self.statement_visitor.visit(node)
+        return "statement_visitor"
 
     def generate(self, module: Module) -> str:
         """
@@ -93,7 +125,14 @@ class CodeGenerator:
 
     def _generate_cpp(self, module: Module) -> str:
         """Generate C++ code for the module."""
+        return "\n".join(self._iter_cpp_parts(module))
+
+    def _iter_cpp_parts(self, module: Module) -> Iterator[str]:
+        """Yield the C++ translation unit for the module one line group at a time."""
         self.scope.reset()
+        self.statement_visitor.reset()
+        self.function_generator.ctrl_stmt.reset()
+        self.data_structure_generator.reset()
 
         # Separate functions from global statements
         fun_defs: List[FunctionDef] = [
@@ -103,15 +142,15 @@ class CodeGenerator:
             n for n in module.body if not isinstance(n, FunctionDef)
         ]
 
-        parts: List[str] = [CPP_PREAMBLE]
+        yield CPP_PREAMBLE
 
         # Generate functions first
         for f in fun_defs:
-            parts.append(self.function_generator.visit(f))
-            parts.append("")
+            yield self.function_generator.visit(f)
+            yield ""
 
         # Generate main() function with global statements
-        parts.append("int main() {")
+        yield "int main() {"
         self.scope.push()
 
         # Check if there's a main function
@@ -121,7 +160,7 @@ class CodeGenerator:
         # Process global statements
         for stmt in globals_:
             stmt_lines = self._emit_cpp_top_stmt(stmt)
-            parts.extend(stmt_lines)
+            yield from stmt_lines
 
             # Check if any of the generated lines contains a call to _fn_main()
             for line in stmt_lines:
@@ -130,18 +169,16 @@ class CodeGenerator:
 
         # If there's a main function but no call was added, add one
         if has_main_function and not main_call_added:
-            parts.append("  _fn_main();")
+            yield "  _fn_main();"
 
         self.scope.pop()
-        parts.append("  return 0;")
-        parts.append("}")
-
-        return "\n".join(parts)
+        yield "  return 0;"
+        yield "}"
 
     def _emit_cpp_top_stmt(self, stmt: AstNode) -> List[str]:
         """Emit C++ code for top-level statements in main()."""
         # Basic statements
-        if isinstance(stmt, (Assign, ExprStmt, Return)):
+        if isinstance(stmt, BASIC_STATEMENTS):
             code = self.basic_stmt_generator.visit(stmt)
             if code.strip():  # Only add non-empty code
                 return ["  " + code]
@@ -149,7 +186,7 @@ class CodeGenerator:
                 return []  # Skip empty code (like import statements)
 
         # Control flow
-        if isinstance(stmt, (If, While, For, Block)):
+        if isinstance(stmt, CONTROL_STATEMENTS):
             # Generate code and check if it contains __name__ == "__main__"
             block_code = self.statement_visitor.visit(stmt)
 
@@ -157,10 +194,7 @@ class CodeGenerator:
             if "__name__" in block_code and "__main__" in block_code:
                 return []  # Skip this if statement
 
-            return [
-                "  " + line if line.strip() else line
-                for line in block_code.splitlines()
-            ]
+            return indent_lines(block_code, "  ")
 
         raise NotImplementedError(
             f"[CodeGenerator] Statement not supported at global level: {type(stmt).__name__}"
@@ -169,15 +203,27 @@ class CodeGenerator:
     def generate_file(self, node, filename: str = "output.cpp"):
         """Generate code for the given AST node and write it to a file."""
         if isinstance(node, Module):
-            # Use the new generate method for modules
-            code = self.generate(node)
+            # Stream the module straight to disk instead of joining it first
+            parts = self._iter_cpp_parts(node)
         else:
             # Fall back to the visit method for individual nodes
-            code = self.visit(node)
             # Include DynamicType system and builtins for non-module nodes
-            code = CPP_PREAMBLE + "\n" + code
-
-        # Write generated code to file
-        with open(file=filename, mode="w", encoding="utf-8") as f:
-            f.write(code)
+            parts = (CPP_PREAMBLE, self.visit(node))
+
+        # Write to a sibling temp file so a failed generation leaves no partial output
+        tmp_name = f"{filename}.tmp"
+        try:
+            with open(file=tmp_name, mode="w", encoding="utf-8") as f:
+                write = f.write
+                first = True
+                for part in parts:
+                    if not first:
+                        write("\n")
+                    write(part)
+                    first = False
+            os.replace(tmp_name, filename)
+        except BaseException:
+            if os.path.exists(tmp_name):
+                os.remove(tmp_name)
+            raise
         return filename
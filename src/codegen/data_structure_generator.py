@@ -13,11 +13,126 @@ Usage:
 - Returns a string of generated C++ code.
 """
 
-"""
-DataStructureGenerator: Generates C++ code for data structures (lists, tuples, sets, dicts).
+from typing import Callable, Optional
 
-Provides helpers for code generation for collections using DynamicType.
-"""
+from src.core.ast import AstNode, LiteralExpr, ListExpr, TupleExpr, SetExpr, DictExpr
+
+# Upper bound on the number of all-literal collections remembered
+_LITERAL_CACHE_MAX = 1024
+_LITERAL_TYPES = (int, float, str, bool)
+# Code for an int/float literal (floats may also be given as their repr)
+number_code = "DynamicType({})".format
+
+# Element code for literal key parts that need no escaping, by value type
+_LITERAL_VALUE_CODE = {
+    int: number_code,
+    float: number_code,
+    bool: {True: "DynamicType(true)", False: "DynamicType(false)"}.__getitem__,
+}
+
+
+def _literal_key(elements: list) -> Optional[tuple]:
+    """Return a hashable key for an all-literal element list, or None."""
+    key = []
+    for e in elements:
+        if type(e) is not LiteralExpr:
+            return None
+        v = e.value
+        if not isinstance(v, _LITERAL_TYPES):
+            return None
+        # repr() keeps 0.0 and -0.0 apart for floats
+        key.append((type(v), repr(v) if type(v) is float else v))
+    return tuple(key)
+
+
+_STRING_LITERAL_PREFIX = "DynamicType(std::string("
+
+
+def dict_key_code(key, key_code: str) -> str:
+    """
+    Return the std::string key expression for a dict entry.
+    Literal str/int keys are emitted as C++ string literals; anything else is
+    converted at runtime with toString().
+    """
+    if type(key) is LiteralExpr:
+        v = key.value
+        if type(v) is str and key_code.startswith(_STRING_LITERAL_PREFIX):
+            # DynamicType(std::string("...")) -> "..." (already escaped)
+            return key_code[len(_STRING_LITERAL_PREFIX):-2]
+        if type(v) is int:
+            return f'"{v}"'
+    return f"({key_code}).toString()"
+
+
+# Collection node classes; subclasses are generated like their base class
+_COLLECTION_NODES = (ListExpr, TupleExpr, SetExpr, DictExpr)
+
+
+def _collection_children(node: AstNode) -> list:
+    """Element (or key/value) nodes of a collection node."""
+    if isinstance(node, DictExpr):
+        return [part for pair in node.pairs for part in pair]
+    return node.elements
+
+
+# Fixed pieces of generated collection code
+_VEC_PREFIX = "DynamicType(std::vector<DynamicType>{"
+_SET_PREFIX = "DynamicType(std::unordered_set<DynamicType>{"
+_MAP_PREFIX = "DynamicType(std::map<std::string, DynamicType>{"
+_COLLECTION_SUFFIX = "})"
+
+# Complete code for empty collections
+_EMPTY_VECTOR = _VEC_PREFIX + _COLLECTION_SUFFIX
+_EMPTY_SET = _SET_PREFIX + _COLLECTION_SUFFIX
+_EMPTY_MAP = _MAP_PREFIX + _COLLECTION_SUFFIX
+
+# Vectors of 4-16 elements are written one element per line
+_VEC_MULTILINE_PREFIX = _VEC_PREFIX + "\n    "
+_VEC_MULTILINE_SUFFIX = "\n" + _COLLECTION_SUFFIX
+_VEC_ELEMENT_SEP = ",\n    "
+
+# Above this many elements, build vectors by moving elements in (see below)
+_VECTOR_INIT_LIST_MAX = 16
+
+
+# Single-line vector code for 0-3 elements, indexed by element count; the
+# templates are stored as bound str.format methods so calls skip the
+# per-call attribute lookup
+_SHORT_VECTOR_FORMATS = tuple(
+    template.format
+    for template in (
+        "DynamicType(std::vector<DynamicType>{{}})",
+        "DynamicType(std::vector<DynamicType>{{{}}})",
+        "DynamicType(std::vector<DynamicType>{{{}, {}}})",
+        "DynamicType(std::vector<DynamicType>{{{}, {}, {}}})",
+    )
+)
+
+
+def create_dynamic_vector(elements: list) -> str:
+    """Create DynamicType vector code with consistent formatting."""
+    if len(elements) > _VECTOR_INIT_LIST_MAX:
+        # Braced initializer lists can only be copied from; for long literals
+        # reserve once and emplace each element so it is moved instead.
+        return "\n".join(
+            [
+                "[&]() {",
+                "    std::vector<DynamicType> __vec_tmp;",
+                f"    __vec_tmp.reserve({len(elements)});",
+                *[f"    __vec_tmp.emplace_back({e});" for e in elements],
+                "    return DynamicType(std::move(__vec_tmp));",
+                "}()",
+            ]
+        )
+    if len(elements) <= 3:
+        return _SHORT_VECTOR_FORMATS[len(elements)](*elements)
+    else:
+        return f"{_VEC_MULTILINE_PREFIX}{_VEC_ELEMENT_SEP.join(elements)}{_VEC_MULTILINE_SUFFIX}"
+
+
+def _set_code(elements: list) -> str:
+    """Create DynamicType set code from already generated element code."""
+    return f"{_SET_PREFIX}{', '.join(elements)}{_COLLECTION_SUFFIX}"
 
 
 class DataStructureGenerator:
@@ -25,6 +140,8 @@ class DataStructureGenerator:
     Generates C++ code for data structure nodes (lists, tuples, sets, dicts).
     """
 
+    __slots__ = ("expr_generator", "_dispatch", "_resolved", "_literal_cache")
+
     def __init__(self, expr_generator=None):
         """
         Initialize the DataStructureGenerator for C++ code generation.
@@ -32,29 +149,121 @@ class DataStructureGenerator:
                         expr_generator: Optional ExprGenerator for evaluating element expressions
         """
         self.expr_generator = expr_generator
+        # Node class -> bound visitor, so visit() is a single dict lookup
+        self._dispatch = {
+            ListExpr: self.visit_ListExpr_cpp,
+            TupleExpr: self.visit_TupleExpr_cpp,
+            SetExpr: self.visit_SetExpr_cpp,
+            DictExpr: self.visit_DictExpr_cpp,
+        }
+        # id(nested collection) -> generated code, while visit() runs
+        self._resolved = {}
+        # Generated code for all-literal lists/tuples/sets of the current
+        # module, keyed by kind and element values
+        self._literal_cache = {}
 
-    def _create_dynamic_vector(self, elements: list) -> str:
-        """Helper method to create DynamicType vector code with consistent formatting."""
-        if len(elements) <= 3:
-            elements_str = ", ".join(elements)
-            return f"DynamicType(std::vector<DynamicType>{{{elements_str}}})"
-        else:
-            elements_str = ",\n    ".join(elements)
-            return f"DynamicType(std::vector<DynamicType>{{\n    {elements_str}\n}})"
+    def reset(self):
+        """Drop per-module state so remembered literals don't outlive a generation."""
+        self._literal_cache.clear()
 
     def visit(self, node) -> str:
         """
         Dispatch code generation to the appropriate method based on node type.
+        Nested collections are generated innermost first from an explicit
+        stack, so deep literals don't recurse once per nesting level.
         Args:
                 node: AST node object
         Returns:
                 str: Generated code for the node.
         """
-        method_name = f"visit_{node.__class__.__name__}_cpp"
-        visitor = getattr(self, method_name, None)
-        if visitor and callable(visitor):
+        dispatch = self._dispatch
+        try:
+            visitor = dispatch[type(node)]
+        except KeyError:
+            visitor = self._resolve_visitor(type(node))
+            if visitor is None:
+                return self.generic_visit(node)
+
+        # Collection nodes nested inside this one, parents before children
+        nested = []
+        stack = [node]
+        while stack:
+            for child in _collection_children(stack.pop()):
+                if isinstance(child, _COLLECTION_NODES):
+                    nested.append(child)
+                    stack.append(child)
+        if not nested:
+            return visitor(node)
+
+        outer_resolved = self._resolved
+        resolved = self._resolved = {}
+        try:
+            for child in reversed(nested):
+                child_visitor = dispatch.get(type(child)) or self._resolve_visitor(type(child))
+                resolved[id(child)] = child_visitor(child)
             return visitor(node)
-        return self.generic_visit(node)
+        finally:
+            self._resolved = outer_resolved
+
+    def _resolve_visitor(self, cls: type) -> Optional[Callable[[AstNode], str]]:
+        """
+        Find and remember the visitor for a subclass of a collection node,
+        which is the visitor of its nearest collection base class.
+        """
+        dispatch = self._dispatch
+        for klass in cls.__mro__:
+            visitor = dispatch.get(klass)
+            if visitor is not None:
+                dispatch[cls] = visitor
+                return visitor
+        return None
+
+    def _element_visitor(self) -> Callable[[AstNode], str]:
+        """Return the visit function used for collection elements."""
+        if self.expr_generator is not None:
+            visit_fn = self.expr_generator.visit
+        else:
+            visit_fn = self.visit
+        resolved = self._resolved
+        if not resolved:
+            return visit_fn
+        # Nested collections were already generated by visit()
+        return lambda e: resolved.get(id(e)) or visit_fn(e)
+
+    def _cached_literal(
+        self, kind: str, elements: list, build: Callable[[list], str]
+    ) -> str:
+        """
+        Return build(element_codes), reusing the result for repeated
+        all-literal collections of the same kind.
+        """
+        values = _literal_key(elements)
+        if values is None:
+            visit_fn = self._element_visitor()
+            return build([visit_fn(e) for e in elements])
+
+        key = (kind, values)
+        literal_cache = self._literal_cache
+        code = literal_cache.get(key)
+        if code is not None:
+            return code
+        try:
+            # Numbers and bools are formatted straight from the key in the
+            # same pass, skipping the per-element visitor dispatch
+            code = build([_LITERAL_VALUE_CODE[t](v) for t, v in values])
+        except KeyError:
+            # String literals need the expression generator's escaping
+            visit_fn = self._element_visitor()
+            code = build([visit_fn(e) for e in elements])
+        if len(literal_cache) < _LITERAL_CACHE_MAX:
+            literal_cache[key] = code
+        return code
+
+    def _vector_code(self, elements: list) -> str:
+        """Generate DynamicType vector code, reusing it for repeated all-literal lists."""
+        if not elements:
+            return _EMPTY_VECTOR
+        return self._cached_literal("vector", elements, create_dynamic_vector)
 
     def generic_visit(self, node) -> str:
         """
@@ -77,14 +286,7 @@ class DataStructureGenerator:
         Returns:
                 str: C++ DynamicType vector code.
         """
-        elements = []
-        for e in node.elements:
-            if self.expr_generator:
-                elements.append(self.expr_generator.visit(e))
-            else:
-                elements.append(self.visit(e))
-        
-        return self._create_dynamic_vector(elements)
+        return self._vector_code(node.elements)
 
 
 
@@ -97,15 +299,8 @@ class DataStructureGenerator:
         Returns:
                 str: C++ DynamicType code representing a tuple.
         """
-        elements = []
-        for e in node.elements:
-            if self.expr_generator:
-                elements.append(self.expr_generator.visit(e))
-            else:
-                elements.append(self.visit(e))
-        
         # For now, represent tuples as immutable lists
-        return self._create_dynamic_vector(elements)
+        return self._vector_code(node.elements)
 
 
 
@@ -117,16 +312,10 @@ class DataStructureGenerator:
         Returns:
                 str: C++ DynamicType set code.
         """
-        elements = []
-        for e in node.elements:
-            if self.expr_generator:
-                elements.append(self.expr_generator.visit(e))
-            else:
-                elements.append(self.visit(e))
-        
         # Use std::unordered_set<DynamicType> for proper set semantics
-        elements_str = ', '.join(elements)
-        return f"DynamicType(std::unordered_set<DynamicType>{{{elements_str}}})"
+        if not node.elements:
+            return _EMPTY_SET
+        return self._cached_literal("set", node.elements, _set_code)
 
 
 
@@ -138,19 +327,29 @@ class DataStructureGenerator:
         Returns:
                 str: C++ DynamicType map code.
         """
-        pairs = []
-        for k, v in node.pairs:
-            key_code = self.expr_generator.visit(k) if self.expr_generator else self.visit(k)
-            val_code = self.expr_generator.visit(v) if self.expr_generator else self.visit(v)
-            # Keys need to be converted to string for map
-            pairs.append(f"{{({key_code}).toString(), {val_code}}}")
-        
-        if len(pairs) <= 2:
+        if not node.pairs:
+            return _EMPTY_MAP
+        visit_fn = self._element_visitor()
+        if len(node.pairs) <= 2:
             # Short dictionaries on one line
-            pairs_str = ', '.join(pairs)
-            return f"DynamicType(std::map<std::string, DynamicType>{{{pairs_str}}})"
+            out = [_MAP_PREFIX]
+            separator = ", "
         else:
             # Long dictionaries with line breaks
-            pairs_str = ',\n'.join(pairs)
-            return f"DynamicType(std::map<std::string, DynamicType>{{\n{pairs_str}}})"
+            out = [_MAP_PREFIX, "\n"]
+            separator = ",\n"
+
+        # Pieces of every pair go straight into one buffer that is joined once
+        append = out.append
+        for i, (k, v) in enumerate(node.pairs):
+            if i:
+                append(separator)
+            append("{")
+            # Keys need to be converted to string for map
+            append(dict_key_code(k, visit_fn(k)))
+            append(", ")
+            append(visit_fn(v))
+            append("}")
+        append(_COLLECTION_SUFFIX)
+        return "".join(out)
 
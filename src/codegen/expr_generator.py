@@ -4,7 +4,10 @@ ExprGenerator: Generates C++ code for expressions and literals.
 Handles operators, literals, function calls, data structures, and method calls.
 Converts Python expressions to DynamicType-based C++ code.
 """
-from typing import Optional
+import functools
+import sys
+from types import MappingProxyType
+from typing import Callable, List, Optional
 from src.core import (
     AstNode,
     LiteralExpr,
@@ -14,6 +17,18 @@ from src.core import (
     CallExpr,
     Attribute,
     TupleExpr,
+    ListExpr,
+    Subscript,
+)
+from src.core.ast import ComparisonExpr, DictExpr, SetExpr
+from .data_structure_generator import (
+    _COLLECTION_NODES,
+    _COLLECTION_SUFFIX,
+    _MAP_PREFIX,
+    _SET_PREFIX,
+    create_dynamic_vector,
+    dict_key_code,
+    number_code,
 )
 
 _BIN_OP_CPP = {
@@ -32,50 +47,218 @@ _BIN_OP_CPP = {
     "or": "||",
 }
 
+# Fragments computed below are interned, so every table (and every emitted
+# fragment list) shares one object per distinct piece of operator code
+_intern = sys.intern
+
+# Binary operator -> (prefix, infix, suffix) wrapped around the operand code
+_BINARY_TEMPLATES = {
+    op: ("(", _intern(f") {mapped} ("), ")") for op, mapped in _BIN_OP_CPP.items()
+}
+_BINARY_TEMPLATES.update(
+    {
+        "and": ("DynamicType((", ").toBool() && (", ").toBool())"),
+        "or": ("DynamicType((", ").toBool() || (", ").toBool())"),
+        "**": ("DynamicType(pow(", ".toDouble(), ", ".toDouble()))"),
+        "//": ("(", ").floor_div(", ")"),
+    }
+)
+
+# Comparison operator -> infix placed between "DynamicType((" lhs and rhs "))"
+_COMPARISON_INFIX = {op: _intern(f") {mapped} (") for op, mapped in _BIN_OP_CPP.items()}
+
+# Python builtin -> C++ runtime function, with the call's opening paren
+_BUILTIN_CALL_PREFIX = MappingProxyType({
+    name: _intern(cpp_name + "(")
+    for name, cpp_name in {
+        "print": "print",
+        "len": "len",
+        "range": "range",
+        "str": "str",
+        "int": "int_",
+        "float": "float_",
+        "bool": "bool_",
+        "abs": "abs",
+        "min": "min",
+        "max": "max",
+        "sum": "sum",
+        "type": "type",
+        "input": "input",
+        "set": "::set",
+    }.items()
+})
+
+
+def _method_renderer(cpp_method: str) -> Callable[[str, List[str]], str]:
+    """Renderer calling `cpp_method` on the object with the given arguments."""
+    infix = _intern(")." + cpp_method + "(")
+    return lambda obj, args: f"({obj}{infix}{', '.join(args)})"
+
+
+def _render_pop(obj: str, args: List[str]) -> str:
+    # list.pop() removes the last element; dict.pop(key) removes a key
+    if args:
+        return f"({obj}).removeKey({args[0]})"
+    return f"({obj}).removeAt(DynamicType(-1))"
+
+
+# Python collection method -> renderer taking the object and argument code
+_METHOD_RENDERERS = MappingProxyType(
+    {
+        "append": _method_renderer("append"),
+        "pop": _render_pop,
+        "remove": _method_renderer("remove"),
+        "get": _method_renderer("get"),
+        "add": _method_renderer("add"),
+        "discard": _method_renderer("remove"),
+        # Dict views take no arguments
+        "keys": lambda obj, args: f"({obj}).keys()",
+        "values": lambda obj, args: f"({obj}).values()",
+        "items": lambda obj, args: f"({obj}).items()",
+    }
+)
+
+# Code for the constant literals
+_DT_TRUE = "DynamicType(true)"
+_DT_FALSE = "DynamicType(false)"
+_DT_NONE = "DynamicType()"
+_DT_ZERO = "DynamicType(0)"
+_NEGATE_PREFIX = "(" + _DT_ZERO + " - ("
+
+# Loop bounds, indices and counters are mostly small ints; their code is
+# built once. Lookups must be guarded by `type(v) is int` since True == 1
+# and 1.0 == 1 would otherwise hit the same entries.
+_SMALL_INT_CODE = {i: number_code(i) for i in range(-5, 257)}
+
+# Slice emitters keyed by (start and end both omitted, kind of step); each
+# takes the object, start, end and step code (omitted bounds already filled in)
+_STEP_NONE, _STEP_ONE, _STEP_OTHER = range(3)
+_SLICE_EMITTERS = {
+    (True, _STEP_NONE): lambda o, s, e, st: f"({o})",
+    (True, _STEP_ONE): lambda o, s, e, st: f"({o}).sublist({s}, {e}, {st})",
+    (True, _STEP_OTHER): lambda o, s, e, st: f"({o}).sublist({s}, {e}, {st})",
+    (False, _STEP_NONE): lambda o, s, e, st: f"({o}).sublist({s}, {e})",
+    (False, _STEP_ONE): lambda o, s, e, st: f"({o}).sublist({s}, {e})",
+    (False, _STEP_OTHER): lambda o, s, e, st: f"({o}).sublist({s}, {e}, {st})",
+}
+
+# Parameter name for a sliced object that must be evaluated only once
+_SLICE_OBJ = "__slice_obj"
+
+_VISIT_PREFIX = sys.intern("visit_")
 
+# C++ escapes for the characters string literals must not contain raw
+_ESCAPE_TABLE = str.maketrans(
+    {"\\": r"\\", '"': r"\"", "\n": r"\n", "\r": r"\r", "\t": r"\t"}
+)
+_NEEDS_ESCAPE = frozenset(chr(c) for c in _ESCAPE_TABLE)
+
+
+def _is_literal_one(node: Optional[AstNode]) -> bool:
+    """True for the literal 1 (e.g. an explicit slice step of 1)."""
+    return type(node) is LiteralExpr and node.value == 1
+
+
+@functools.lru_cache(maxsize=4096)
 def _escape_cpp_string(s: str) -> str:
-    return (
-        s.replace("\\", r"\\")
-        .replace('"', r"\"")
-        .replace("\n", r"\n")
-        .replace("\r", r"\r")
-        .replace("\t", r"\t")
-    )
+    # Repeated literals hit the cache; plain strings need no rewriting
+    if not _NEEDS_ESCAPE.intersection(s):
+        return s
+    return s.translate(_ESCAPE_TABLE)
+
+
+def _small_int_code(v: int) -> str:
+    code = _SMALL_INT_CODE.get(v)
+    return code if code is not None else number_code(v)
+
+
+def _string_code(v: str) -> str:
+    return 'DynamicType(std::string("' + _escape_cpp_string(v) + '"))'
+
+
+# Exact literal value type -> code formatter; bool has its own entry, so it
+# is never formatted as an int
+_LITERAL_FORMATTERS = {
+    int: _small_int_code,
+    float: number_code,
+    str: _string_code,
+    bool: {True: _DT_TRUE, False: _DT_FALSE}.__getitem__,
+    type(None): lambda v: _DT_NONE,
+}
 
 
 class ExprGenerator:
+    __slots__ = ("scope", "_data_structure_generator", "_handlers")
+
     def __init__(self, scope: Optional[object] = None):
         self.scope = scope
-        self.data_structure_generator = None
-
-    def _create_dynamic_vector(self, elements: list) -> str:
-        """Helper method to create DynamicType vector code with consistent formatting."""
-        if len(elements) <= 3:
-            elements_str = ", ".join(elements)
-            return f"DynamicType(std::vector<DynamicType>{{{elements_str}}})"
-        else:
-            elements_str = ",\n    ".join(elements)
-            return f"DynamicType(std::vector<DynamicType>{{\n    {elements_str}\n}})"
+        self._data_structure_generator = None
+        # Node class -> bound visitor, filled on first use of each class
+        self._handlers = {}
+
+    @property
+    def data_structure_generator(self):
+        return self._data_structure_generator
+
+    @data_structure_generator.setter
+    def data_structure_generator(self, generator) -> None:
+        # Collection nodes dispatch straight to the generator's visit, so the
+        # visit_*Expr collection methods below only run when none is set
+        self._data_structure_generator = generator
+        self._handlers = (
+            {} if generator is None else dict.fromkeys(_COLLECTION_NODES, generator.visit)
+        )
 
     def visit(self, node: AstNode) -> str:
-        m = getattr(self, f"visit_{type(node).__name__}", None)
-        if not m or not callable(m):
-            raise NotImplementedError(
-                f"ExprGenerator does not support nodes of type {type(node).__name__}"
-            )
-        return m(node)
+        cls = type(node)
+        # The most frequent leaves are handled inline, without a handler call
+        if cls is Identifier:
+            name = node.name
+            if name != "__name__":
+                return name
+        elif cls is LiteralExpr:
+            v = node.value
+            t = type(v)
+            if t is int:
+                code = _SMALL_INT_CODE.get(v)
+                return code if code is not None else number_code(v)
+            if t is float:
+                return number_code(v)
+        handler = self._handlers.get(cls)
+        if handler is None:
+            handler = self._resolve_handler(cls)
+        return handler(node)
+
+    def _resolve_handler(self, cls: type) -> Callable[[AstNode], str]:
+        """
+        Look up and remember the visit method for a node class. Subclasses
+        of supported nodes use the visitor of their nearest base class.
+        """
+        handlers = self._handlers
+        for klass in cls.__mro__:
+            m = handlers.get(klass)
+            if m is None:
+                m = getattr(self, _VISIT_PREFIX + klass.__name__, None)
+            if m is not None and callable(m):
+                handlers[cls] = m
+                return m
+        raise NotImplementedError(
+            f"ExprGenerator does not support nodes of type {cls.__name__}"
+        )
 
     def visit_LiteralExpr(self, node: LiteralExpr) -> str:
         v = node.value
+        formatter = _LITERAL_FORMATTERS.get(type(v))
+        if formatter is not None:
+            return formatter(v)
 
+        # Subclasses of the supported types
         if isinstance(v, str):
-            return f'DynamicType(std::string("{_escape_cpp_string(v)}"))'
+            return _string_code(v)
         if isinstance(v, bool):
-            return f"DynamicType({str(v).lower()})"
-        if v is None:
-            return "DynamicType()"
+            return _DT_TRUE if v else _DT_FALSE
         if isinstance(v, (int, float)):
-            return f"DynamicType({v})"
+            return number_code(v)
 
         raise NotImplementedError(
             f"LiteralExpr with value of type: {type(v).__name__} is not supported"
@@ -90,43 +273,46 @@ class ExprGenerator:
     def visit_UnaryExpr(self, node: UnaryExpr) -> str:
         rhs = self.visit(node.operand)
         if node.op in ("-", "MINUS"):
-            return f"(DynamicType(0) - ({rhs}))"
+            return f"{_NEGATE_PREFIX}{rhs}))"
         if node.op in ("not", "!", "NOT"):
             return f"(!({rhs}))"
         raise NotImplementedError(f"Unary op '{node.op}' is not supported")
 
     def visit_BinaryExpr(self, node: BinaryExpr) -> str:
-        lhs = self.visit(node.left)
-        rhs = self.visit(node.right)
-        op = node.op
-
-        if op == "**":
-            return f"DynamicType(pow({lhs}.toDouble(), {rhs}.toDouble()))"
-
-        if op == "//":
-            return f"({lhs}).floor_div({rhs})"
-
-        mapped = _BIN_OP_CPP.get(op)
-        if not mapped:
-            raise NotImplementedError(f"Binary Op '{op}' is not supported")
-
-        if op in ("and", "or"):
-            return f"DynamicType(({lhs}).toBool() {mapped} ({rhs}).toBool())"
-
-        return f"({lhs}) {mapped} ({rhs})"
+        # The whole operator tree is written into one fragment list, walked
+        # with an explicit stack: each operand's code is copied once instead
+        # of at every enclosing level, and deep nesting on either side
+        # doesn't cost one Python frame per operator. The stack holds
+        # literal fragments and nodes still to be written, last one first.
+        visit = self.visit
+        out = []
+        pending = [node]
+        pop = pending.pop
+        while pending:
+            item = pop()
+            if type(item) is str:
+                out.append(item)
+            elif isinstance(item, BinaryExpr):
+                template = _BINARY_TEMPLATES.get(item.op)
+                if template is None:
+                    raise NotImplementedError(f"Binary Op '{item.op}' is not supported")
+                prefix, infix, suffix = template
+                out.append(prefix)
+                pending += (suffix, item.right, infix, item.left)
+            else:
+                out.append(visit(item))
+        return "".join(out)
 
-    def visit_ComparisonExpr(self, node) -> str:
-        lhs = self.visit(node.left)
-        rhs = self.visit(node.right)
+    def visit_ComparisonExpr(self, node: ComparisonExpr) -> str:
         op = node.op
-
+        visit = self.visit
         if op == "in":
-            return f"DynamicType(({rhs}).contains({lhs}))"
+            return f"DynamicType(({visit(node.right)}).contains({visit(node.left)}))"
 
-        mapped = _BIN_OP_CPP.get(op)
-        if not mapped:
+        infix = _COMPARISON_INFIX.get(op)
+        if infix is None:
             raise NotImplementedError(f"Comparison Op '{op}' is not supported")
-        return f"DynamicType(({lhs}) {mapped} ({rhs}))"
+        return f"DynamicType(({visit(node.left)}{infix}{visit(node.right)}))"
 
     def visit_CallExpr(self, node: CallExpr) -> str:
         if isinstance(node.callee, Identifier):
@@ -136,99 +322,72 @@ class ExprGenerator:
         else:
             raise NotImplementedError("callee type not supported in CallExpr")
 
-        builtin_mapping = {
-            "print": "print",
-            "len": "len",
-            "range": "range",
-            "str": "str",
-            "int": "int_",
-            "float": "float_",
-            "bool": "bool_",
-            "abs": "abs",
-            "min": "min",
-            "max": "max",
-            "sum": "sum",
-            "type": "type",
-            "input": "input",
-            "set": "::set",
-        }
-
-        args = [self.visit(a) for a in node.args]
-
-        if callee in builtin_mapping:
-            cpp_name = builtin_mapping[callee]
-            return f"{cpp_name}({', '.join(args)})"
-        return f"_fn_{callee}({', '.join(args)})"
-
-    def visit_ListExpr(self, node) -> str:
-        if self.data_structure_generator:
-            return self.data_structure_generator.visit(node)
-        elements = [self.visit(e) for e in node.elements]
-        return self._create_dynamic_vector(elements)
-
-    def visit_DictExpr(self, node) -> str:
-        if self.data_structure_generator:
-            return self.data_structure_generator.visit(node)
-        pairs = []
-        for k, v in node.pairs:
-            key_code = self.visit(k)
-            val_code = self.visit(v)
-            pairs.append(f"{{({key_code}).toString(), {val_code}}}")
-        pairs_str = ", ".join(pairs)
-        return f"DynamicType(std::map<std::string, DynamicType>{{{pairs_str}}})"
-
-    def visit_TupleExpr(self, node) -> str:
-        if self.data_structure_generator:
-            return self.data_structure_generator.visit(node)
-        elements = [self.visit(e) for e in node.elements]
-        return self._create_dynamic_vector(elements)
-
-    def visit_SetExpr(self, node) -> str:
-        if self.data_structure_generator:
-            return self.data_structure_generator.visit(node)
-        elements = [self.visit(e) for e in node.elements]
-        elements_str = ", ".join(elements)
-        return f"DynamicType(std::unordered_set<DynamicType>{{{elements_str}}})"
-
-    def visit_Subscript(self, node) -> str:
+        prefix = _BUILTIN_CALL_PREFIX.get(callee)
+        if prefix is None:
+            prefix = f"_fn_{callee}("
+        visit = self.visit
+        return f"{prefix}{', '.join([visit(a) for a in node.args])})"
+
+    def visit_ListExpr(self, node: ListExpr) -> str:
+        visit = self.visit
+        return create_dynamic_vector([visit(e) for e in node.elements])
+
+    # Tuples are emitted as vectors as well
+    visit_TupleExpr = visit_ListExpr
+
+    def visit_DictExpr(self, node: DictExpr) -> str:
+        visit = self.visit
+        out = [_MAP_PREFIX]
+        append = out.append
+        for i, (k, v) in enumerate(node.pairs):
+            if i:
+                append(", ")
+            append("{")
+            append(dict_key_code(k, visit(k)))
+            append(", ")
+            append(visit(v))
+            append("}")
+        append(_COLLECTION_SUFFIX)
+        return "".join(out)
+
+    def visit_SetExpr(self, node: SetExpr) -> str:
+        visit = self.visit
+        elements = [visit(e) for e in node.elements]
+        return f"{_SET_PREFIX}{', '.join(elements)}{_COLLECTION_SUFFIX}"
+
+    def visit_Subscript(self, node: Subscript) -> str:
         obj_code = self.visit(node.value)
 
         if isinstance(node.index, TupleExpr):
             elements = node.index.elements
-
-            def slice_param(elem):
-                if elem is None:
-                    return "DynamicType()"
-                return self.visit(elem)
-
-            if len(elements) == 3:
-                start = slice_param(elements[0])
-                end = slice_param(elements[1])
-                step = slice_param(elements[2])
-
-                if elements[0] is None and elements[1] is None:
-                    if elements[2] is None:
-                        return f"({obj_code})"
-                    else:
-                        return f"({obj_code}).sublist(DynamicType(0), len({obj_code}), {step})"
-                elif elements[2] is None or (
-                    hasattr(elements[2], "value") and elements[2].value == 1
-                ):
-                    if elements[0] is None:
-                        start = "DynamicType(0)"
-                    if elements[1] is None:
-                        end = f"len({obj_code})"
-                    return f"({obj_code}).sublist({start}, {end})"
-                else:
-                    if elements[0] is None:
-                        start = "DynamicType(0)"
-                    if elements[1] is None:
-                        end = f"len({obj_code})"
-                    return f"({obj_code}).sublist({start}, {end}, {step})"
-            else:
+            if len(elements) != 3:
                 raise NotImplementedError(
                     f"Invalid slice tuple length: {len(elements)}"
                 )
+            start_node, end_node, step_node = elements
+            visit = self.visit
+            start = _DT_ZERO if start_node is None else visit(start_node)
+            step = _DT_NONE if step_node is None else visit(step_node)
+
+            if step_node is None:
+                step_kind = _STEP_NONE
+            elif _is_literal_one(step_node):
+                step_kind = _STEP_ONE
+            else:
+                step_kind = _STEP_OTHER
+            whole = start_node is None and end_node is None
+            emit = _SLICE_EMITTERS[whole, step_kind]
+            if end_node is not None:
+                return emit(obj_code, start, visit(end_node), step)
+            if whole and step_kind == _STEP_NONE:
+                # Plain copy: the end bound is never emitted
+                return emit(obj_code, start, None, step)
+            if type(node.value) is Identifier:
+                return emit(obj_code, start, f"len({obj_code})", step)
+            # The object is needed twice (sliced and measured); evaluate a
+            # non-trivial object expression only once
+            code = emit(_SLICE_OBJ, start, f"len({_SLICE_OBJ})", step)
+            return f"[&](const DynamicType& {_SLICE_OBJ}) {{ return {code}; }}({obj_code})"
 
         index_code = self.visit(node.index)
         return f"({obj_code})[{index_code}]"
@@ -237,51 +396,14 @@ class ExprGenerator:
         obj_code = self.visit(node.value)
         return f"({obj_code}).{node.attr}"
 
-    def _handle_method_call(self, callee: Attribute, args) -> str:
-        obj_code = self.visit(callee.value)
+    def _handle_method_call(self, callee: Attribute, args: List[AstNode]) -> str:
+        visit = self.visit
+        obj_code = visit(callee.value)
         method_name = callee.attr
-        args_code = [self.visit(a) for a in args]
-
-        data_structure_methods = {
-            "append": {"params": 1, "cpp_method": "append"},
-            "pop": {
-                "params": -1,
-                "cpp_method": "removeAt",
-                "default_args": ["DynamicType(-1)"],
-            },
-            "remove": {
-                "params": 1,
-                "cpp_method": "remove",
-            },
-            "get": {"params": 1, "cpp_method": "get"},
-            "add": {"params": 1, "cpp_method": "add"},
-            "discard": {
-                "params": 1,
-                "cpp_method": "remove",
-            },
-        }
-
-        if method_name in data_structure_methods:
-            method_info = data_structure_methods[method_name]
-            cpp_method = method_info["cpp_method"]
-
-            if method_name == "pop":
-                if len(args) == 0:
-                    return f"({obj_code}).removeAt(DynamicType(-1))"
-                return f"({obj_code}).removeKey({args_code[0]})"
-            if method_name in ["sublist", "slice"]:
-                if len(args_code) == 2:
-                    return f"({obj_code}).sublist({args_code[0]}, {args_code[1]})"
-
-            args_str = ", ".join(args_code)
-            return f"({obj_code}).{cpp_method}({args_str})"
-
-        if method_name == "keys":
-            return f"({obj_code}).keys()"
-        if method_name == "values":
-            return f"({obj_code}).values()"
-        if method_name == "items":
-            return f"({obj_code}).items()"
+        args_code = [visit(a) for a in args]
 
+        render = _METHOD_RENDERERS.get(method_name)
+        if render is not None:
+            return render(obj_code, args_code)
         args_str = ", ".join(args_code)
         return f"({obj_code}).{method_name}({args_str})"
@@ -10,35 +10,40 @@ Key Features:
 - Used by CodeGenerator to handle all function-related code generation.
 """
 
-from typing import List
-from src.core import (
-    AstNode,
-    FunctionDef,
-    Identifier,
-    Assign,
-    ExprStmt,
-    Return,
-    Block,
-    If,
-    While,
-    For,
-)
+from typing import List, Optional
+from src.core import AstNode, FunctionDef, Identifier, Return
 from .scope_manager import ScopeManager
 from .expr_generator import ExprGenerator
 from .basic_statement_generator import BasicStatementGenerator
-from .statement_generator import StatementVisitor
+from .statement_generator import (
+    BASIC_STATEMENTS,
+    CONTROL_STATEMENTS,
+    StatementVisitor,
+    indent_lines,
+)
 
 
 class FunctionGenerator:
-    def __init__(self, scope: ScopeManager):
+    def __init__(
+        self,
+        scope: ScopeManager,
+        expr_generator: Optional[ExprGenerator] = None,
+        basic_stmt_generator: Optional[BasicStatementGenerator] = None,
+    ):
         """
         Initializes the FunctionGenerator for C++ code generation.
         Args:
                 scope (ScopeManager): Scope manager for tracking variable declarations.
+                expr_generator: Optional shared ExprGenerator
+                basic_stmt_generator: Optional shared BasicStatementGenerator
         """
         self.scope = scope
-        self.expr_gen = ExprGenerator(scope=self.scope)
-        self.basic_stmt = BasicStatementGenerator(self.scope)
+        if expr_generator is None:
+            expr_generator = ExprGenerator(scope=self.scope)
+        if basic_stmt_generator is None:
+            basic_stmt_generator = BasicStatementGenerator(self.scope, expr_generator)
+        self.expr_gen = expr_generator
+        self.basic_stmt = basic_stmt_generator
         self.ctrl_stmt = StatementVisitor(
             expr_generator=self.expr_gen,
             scope_manager=self.scope,
@@ -50,40 +55,32 @@ class FunctionGenerator:
             raise TypeError("FunctionGenerator.visit() expects a FunctionDef")
 
         #  ------- Function Definition -------
-        param_names: List[str] = []
-        for p in node.params:
-            if isinstance(p, Identifier):
-                param_names.append(p.name)
-            else:
-                param_names.append(str(p))
+        param_names: List[str] = [
+            p.name if isinstance(p, Identifier) else str(p) for p in node.params
+        ]
 
         cpp_params = ", ".join(f"DynamicType {n}" for n in param_names)
         header = f"DynamicType _fn_{node.name}({cpp_params}) {{"
         #  ------- Function scope -------
-        self.scope.push()
+        self.scope.push(param_names)
         try:
-            for n in param_names:
-                if not self.scope.exists(n):
-                    self.scope.declare(n)
             #  ------- Function Body -------
-            body_lines: List[str] = []
             # node.body can be either a list of statements or a Block node
             if isinstance(node.body, list):
                 statements = node.body
-            elif hasattr(node.body, "statements"):
-                statements = node.body.statements
             else:
-                statements = [node.body]
+                statements = getattr(node.body, "statements", None)
+                if statements is None:
+                    statements = [node.body]
 
-            for stmt in statements:
-                body_lines.append(self._emit_stmt(stmt))
+            emit_stmt = self._emit_stmt
+            body_lines: List[str] = [emit_stmt(stmt) for stmt in statements]
             has_top_return = any(isinstance(s, Return) for s in statements)
             lines = [header]
             for line in body_lines:
                 if line is None:
                     continue
-                for sub in line.splitlines():
-                    lines.append("	" + sub)
+                lines.extend(indent_lines(line, "	"))
             if not has_top_return:
                 lines.append("	return DynamicType();")
             lines.append("}")
@@ -93,10 +90,10 @@ class FunctionGenerator:
 
     def _emit_stmt(self, stmt: AstNode) -> str:
         # Basic statements (assignments, expressions, returns)
-        if isinstance(stmt, (Assign, ExprStmt, Return)):
+        if isinstance(stmt, BASIC_STATEMENTS):
             return self.basic_stmt.visit(stmt)
         # Control flow statements (if, while, for, blocks)
-        if isinstance(stmt, (If, While, For, Block)):
+        if isinstance(stmt, CONTROL_STATEMENTS):
             return self.ctrl_stmt.visit(stmt)
         # If it's an unknown statement type, try basic_stmt first, then ctrl_stmt
         try:
@@ -15,6 +15,8 @@ class ScopeManager:
     Provides methods to enter/exit scopes, add symbols, and resolve names.
     """
 
+    __slots__ = ("scopes",)
+
     def __init__(self):
         """
         Initializes the scope manager with a global scope.
@@ -77,9 +79,9 @@ class ScopeManager:
         return list(self.scopes)
 
     # -------- implemented by person 2 --------
-    def push(self):
-        """Alias for enter_scope()."""
-        self.enter_scope()
+    def push(self, names=()):
+        """Alias for enter_scope(), optionally pre-declaring names in the new scope."""
+        self.scopes.append(dict.fromkeys(names, True))
 
     def pop(self):
         """Alias for exit_scope(); doesn't crash if in global scope."""
@@ -100,4 +102,8 @@ class ScopeManager:
 
     def exists(self, name) -> bool:
         """Does the name exist in any visible scope?"""
-        return self.resolve_symbol(name) is not None
+        # Same lookup as resolve_symbol(), inlined: this runs for every assignment
+        for scope in reversed(self.scopes):
+            if name in scope:
+                return scope[name] is not None
+        return False
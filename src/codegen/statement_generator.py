@@ -1,17 +1,105 @@
 """
 StatementVisitor: Generates C++ code for control flow statements.
 
-Handles if/while/for loops, break/continue/pass, bl    def visit_Break_cpp(self, node):
-        return "break;"
-
-    def visit_Continue_cpp(self, node):
-        return "continue;" delegation.
+Handles if/while/for loops, break/continue/pass, blocks, and basic statement
+delegation.
 """
 
+import sys
+import weakref
+
+from src.core import (
+    AstNode,
+    Assign,
+    Attribute,
+    Block,
+    CallExpr,
+    ExprStmt,
+    For,
+    Identifier,
+    If,
+    Return,
+    Subscript,
+    While,
+)
+
+_VISIT_PREFIX = sys.intern("visit_")
+
+# Statement kinds handled by BasicStatementGenerator and by StatementVisitor
+BASIC_STATEMENTS = (Assign, ExprStmt, Return)
+CONTROL_STATEMENTS = (If, While, For, Block)
+
+
+def indent_lines(code: str, prefix: str) -> list:
+    """Split generated code into lines and prefix every non-blank one."""
+    return [prefix + line if line.strip() else line for line in code.splitlines()]
+
+
+def _root_name(node):
+    """Return the variable at the root of an a.b[i].c chain, if any."""
+    while isinstance(node, (Attribute, Subscript)):
+        node = node.value
+    return node.name if isinstance(node, Identifier) else None
+
+
+def _mutation_root(node):
+    """Variable a single node may rebind or mutate (assignment, loop target, method call)."""
+    if isinstance(node, (Assign, For)):
+        return _root_name(node.target)
+    if isinstance(node, CallExpr) and isinstance(node.callee, Attribute):
+        return _root_name(node.callee.value)
+    return None
+
+
+def _children(node):
+    """Child nodes of an AST node or statement list, or None for leaves."""
+    if isinstance(node, (list, tuple)):
+        return node
+    if isinstance(node, AstNode):
+        return list(vars(node).values())
+    return None
+
+
+def _collect_mutations(body, cache: dict) -> frozenset:
+    """
+    Conservatively compute the names a loop body may rebind or mutate.
+    The body is walked once, post-order with an explicit stack, and the
+    result for every nested for-loop body is stored in `cache` as well, so
+    nested loops don't re-walk their subtrees.
+    """
+    names_by_node = {}
+    stack = [(body, False)]
+    while stack:
+        node, expanded = stack.pop()
+        if not expanded:
+            kids = _children(node)
+            if kids is not None:
+                stack.append((node, True))
+                stack.extend((kid, False) for kid in kids)
+            continue
+        names = set()
+        root = _mutation_root(node)
+        if root is not None:
+            names.add(root)
+        for kid in _children(node):
+            kid_names = names_by_node.get(id(kid))
+            if kid_names:
+                names |= kid_names
+        names_by_node[id(node)] = names
+        if isinstance(node, For):
+            body_names = frozenset(names_by_node.get(id(node.body), ()))
+            cache[id(node.body)] = (node.body, body_names)
+    result = frozenset(names_by_node.get(id(body), ()))
+    cache[id(body)] = (body, result)
+    return result
+
 
 class StatementVisitor:
     """Generates C++ code for control flow statements."""
 
+    # Visitor method name per AST node class, computed once per class.
+    _method_name_cache = weakref.WeakKeyDictionary()
+
     def __init__(
         self, expr_generator=None, scope_manager=None, basic_stmt_generator=None
     ):
@@ -28,105 +116,154 @@ class StatementVisitor:
         self.scope_manager = scope_manager
         self.basic_stmt_generator = basic_stmt_generator
         self._iter_counter = 0
+        # id(loop body) -> (body, names it may mutate), see _mutated_names
+        self._mutation_cache = {}
+
+    def reset(self):
+        """Reset per-module state so repeated generations emit identical names."""
+        self.indent_level = 0
+        self._iter_counter = 0
+        self._mutation_cache.clear()
+
+    def _mutated_names(self, body) -> frozenset:
+        """Names a loop body may mutate, computed once per body."""
+        entry = self._mutation_cache.get(id(body))
+        # The cached body is kept alive, so a matching id is the same object
+        if entry is not None and entry[0] is body:
+            return entry[1]
+        return _collect_mutations(body, self._mutation_cache)
 
     def indent(self) -> str:
         return self.indent_str * self.indent_level
 
+    def _visit_expr(self, node) -> str:
+        """Generate an expression through the ExprGenerator, or fall back to str()."""
+        expr_generator = self.expr_generator
+        if expr_generator is None:
+            return str(node)
+        return expr_generator.visit(node)
+
     def visit(self, node) -> str:
-        method_name = f"visit_{node.__class__.__name__}_cpp"
+        cls = type(node)
+        method_name = self._method_name_cache.get(cls)
+        if method_name is None:
+            method_name = sys.intern(_VISIT_PREFIX + cls.__name__ + "_cpp")
+            self._method_name_cache[cls] = method_name
         visitor = getattr(self, method_name, None)
         if visitor and callable(visitor):
             return visitor(node)
         return self.generic_visit(node)
 
     def generic_visit(self, node) -> str:
-        if node.__class__.__name__ in ["ExprStmt", "Assign", "Return"]:
+        if isinstance(node, BASIC_STATEMENTS):
             raise NotImplementedError(
-                f"BasicStatementGenerator should handle {node.__class__.__name__}"
+                f"BasicStatementGenerator should handle {type(node).__name__}"
             )
         raise NotImplementedError(
-            f"StatementVisitor does not support node type {node.__class__.__name__}"
+            f"StatementVisitor does not support node type {type(node).__name__}"
         )
 
+    def _visit_all(self, stmts) -> list:
+        """Generate code for a sequence of statements, in order."""
+        visit = self.visit
+        return [visit(stmt) for stmt in stmts]
+
     # --- C++ Methods ---
     def visit_Block_cpp(self, node):
-        code = []
-        code.append("{")
+        code = ["{"]
+        append = code.append
         self.indent_level += 1
-        for stmt in node.statements:
-            stmt_code = self.visit(stmt)
-            if stmt_code.strip():
-                if not stmt_code.strip().endswith((";", "}")):
-                    stmt_code += ";"
-                code.append(self.indent() + stmt_code)
+        # Every statement in the block shares one indentation prefix
+        indent = self.indent()
+        for stmt_code in self._visit_all(node.statements):
+            # Generated code rarely has surrounding whitespace; only strip when it does
+            trimmed = stmt_code
+            if trimmed and (trimmed[0] <= " " or trimmed[-1] <= " "):
+                trimmed = trimmed.strip()
+            if not trimmed:
+                continue
+            if not trimmed.endswith((";", "}")):
+                stmt_code += ";"
+            append(indent + stmt_code)
         self.indent_level -= 1
         code.append(self.indent() + "}")
         return "\n".join(code)
 
-    def visit_If_cpp(self, node):
-        code = []
-        cond_code = (
-            self.expr_generator.visit(node.cond)
-            if hasattr(self, "expr_generator")
-            else str(node.cond)
-        )
+    def _format_condition(self, cond_code: str) -> str:
+        """Wrap a generated condition so it evaluates to a C++ bool."""
         if cond_code.startswith("DynamicType("):
-            code.append(f"if ({cond_code}.toBool())")
-        else:
-            code.append(f"if (DynamicType({cond_code}).toBool())")
+            return f"{cond_code}.toBool()"
+        return f"DynamicType({cond_code}).toBool()"
+
+    @staticmethod
+    def _open_block(header: str, block_code: str) -> str:
+        """Put a braced block's opening brace on its header line."""
+        if block_code.startswith("{"):
+            return header + " " + block_code
+        return header + "\n" + block_code
+
+    def _chain_block(self, code: list, header: str, block_code: str) -> None:
+        """Append an else/else-if branch, fusing it onto the previous closing brace."""
+        code.append(" " if code[-1].endswith("}") else "\n")
+        code.append(self._open_block(header, block_code))
 
-        body_code = self.visit(node.body)
-        code.append(body_code)
+    def visit_If_cpp(self, node):
+        visit = self.visit
+        cond_code = self._visit_expr(node.cond)
+        header = f"if ({self._format_condition(cond_code)})"
+        body_code = visit(node.body)
+
+        elifs = node.elifs
+        orelse = node.orelse
+        if not elifs and not orelse:
+            # Plain `if` without elif/else branches
+            return self._open_block(header, body_code)
 
-        for elif_cond, elif_body in getattr(node, "elifs", []):
-            elif_cond_code = (
-                self.expr_generator.visit(elif_cond)
-                if hasattr(self, "expr_generator")
-                else str(elif_cond)
+        # Branches and their separators are collected and joined once, so
+        # long elif chains don't re-copy the growing statement per branch.
+        code = [self._open_block(header, body_code)]
+        visit_expr = self._visit_expr
+        chain_block = self._chain_block
+        for elif_cond, elif_body in elifs:
+            chain_block(
+                code,
+                f"else if (({visit_expr(elif_cond)}).toBool())",
+                visit(elif_body),
             )
-            code.append(f"else if (({elif_cond_code}).toBool())")
-            code.append(self.visit(elif_body))
 
-        if hasattr(node, "orelse") and node.orelse:
-            code.append("else")
-            code.append(self.visit(node.orelse))
+        if orelse:
+            chain_block(code, "else", visit(orelse))
 
-        return "\n".join(code)
+        return "".join(code)
 
     def visit_While_cpp(self, node):
-        cond_code = (
-            self.expr_generator.visit(node.cond)
-            if hasattr(self, "expr_generator")
-            else str(node.cond)
+        cond_code = self._visit_expr(node.cond)
+        return self._open_block(
+            f"while ({self._format_condition(cond_code)})", self.visit(node.body)
         )
-        if cond_code.startswith("DynamicType("):
-            code = [f"while ({cond_code}.toBool())"]
-        else:
-            code = [f"while (DynamicType({cond_code}).toBool())"]
-        code.append(self.visit(node.body))
-        return "\n".join(code)
 
     def visit_For_cpp(self, node):
-        iterable_code = (
-            self.expr_generator.visit(node.iterable)
-            if hasattr(self, "expr_generator")
-            else str(node.iterable)
-        )
-        target_code = (
-            self.expr_generator.visit(node.target)
-            if hasattr(self, "expr_generator")
-            else str(node.target)
-        )
+        iterable_code = self._visit_expr(node.iterable)
+        target_code = self._visit_expr(node.target)
 
         self._iter_counter += 1
         temp_var = f"__iter_temp_{self._iter_counter}"
         elem_type = "auto"
         code = ["{"]
-        code.append(f"  auto {temp_var} = ({iterable_code}).getList();")
-        code.append(f"  for ({elem_type} {target_code} : {temp_var})")
-        body_code = self.visit(node.body)
-        for line in body_code.splitlines():
-            code.append(f"  {line}")
+        iterable = node.iterable
+        if (
+            isinstance(iterable, Identifier)
+            and iterable_code == iterable.name
+            and iterable.name not in self._mutated_names(node.body)
+        ):
+            # The body never touches the list, so iterate it in place
+            code.append(f"  const auto& {temp_var} = ({iterable_code}).getList();")
+        else:
+            code.append(f"  auto {temp_var} = ({iterable_code}).getList();")
+        loop_code = self._open_block(
+            f"for ({elem_type} {target_code} : {temp_var})", self.visit(node.body)
+        )
+        code.extend(indent_lines(loop_code, "  "))
         code.append("}")
         return "\n".join(code)
 
@@ -140,7 +277,7 @@ class StatementVisitor:
         return "/* pass */"
 
     def visit_ExprStmt_cpp(self, node):
-        if hasattr(self, "expr_generator") and self.expr_generator:
+        if self.expr_generator is not None:
             code = self.expr_generator.visit(node.value)
             return f"{code};"
         else:
@@ -150,8 +287,8 @@ class StatementVisitor:
         if self.basic_stmt_generator:
             return self.basic_stmt_generator.visit(node)
 
-        if hasattr(node.target, "name"):
-            name = node.target.name
+        name = getattr(node.target, "name", None)
+        if name is not None:
             rhs_code = self.expr_generator.visit(node.value)
 
             if self.scope_manager and not self.scope_manager.exists(name):
@@ -167,7 +304,7 @@ class StatementVisitor:
     def visit_Return_cpp(self, node):
         if node.value is None:
             return "return DynamicType();"
-        elif hasattr(self, "expr_generator") and self.expr_generator:
+        elif self.expr_generator is not None:
             return f"return {self.expr_generator.visit(node.value)};"
         else:
             return "return DynamicType();"
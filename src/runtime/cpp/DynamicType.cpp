@@ -165,13 +165,15 @@ bool DynamicType::toBool() const {
 DynamicType DynamicType::operator+(const DynamicType &other) const {
   // Concats
   if (type == Type::LIST && other.type == Type::LIST) {
-    std::vector<DynamicType> left = std::get<std::vector<DynamicType>>(value);
-    std::vector<DynamicType> right = std::get<std::vector<DynamicType>>(other.value);
+    const std::vector<DynamicType>& left = std::get<std::vector<DynamicType>>(value);
+    const std::vector<DynamicType>& right = std::get<std::vector<DynamicType>>(other.value);
     
-    std::vector<DynamicType> result = left;
+    std::vector<DynamicType> result;
+    result.reserve(left.size() + right.size());
+    result.insert(result.end(), left.begin(), left.end());
     result.insert(result.end(), right.begin(), right.end());
     
-    return DynamicType(result);
+    return DynamicType(std::move(result));
   }
 
   if (type == Type::STRING || other.type == Type::STRING) {
@@ -451,25 +453,21 @@ const std::unordered_set<DynamicType>& DynamicType::getSet() const {
   }
 }
 
-DynamicType DynamicType::sublist(size_t start, size_t end) {
+DynamicType DynamicType::sublist(size_t start, size_t end) const {
   if(type != Type::LIST) {
     throw std::runtime_error("Type is not a list");
   }
   
-  std::vector<DynamicType>& list = getList();
+  const std::vector<DynamicType>& list = getList();
   if(start > list.size() || end > list.size() || start > end) {
     throw std::runtime_error("Sublist indices out of range");
   }
   
-  std::vector<DynamicType> newList;
-  for(size_t i = start; i < end; ++i) {
-    newList.push_back(list[i]);
-  }
-  
-  return DynamicType(newList);
+  // Contiguous slice: copy the range in one go
+  return DynamicType(std::vector<DynamicType>(list.begin() + start, list.begin() + end));
 }
 
-DynamicType DynamicType::sublist(size_t start, size_t end, size_t step) {
+DynamicType DynamicType::sublist(size_t start, size_t end, size_t step) const {
   if(type != Type::LIST) {
     throw std::runtime_error("Type is not a list");
   }
@@ -478,17 +476,25 @@ DynamicType DynamicType::sublist(size_t start, size_t end, size_t step) {
     throw std::runtime_error("Step cannot be zero");
   }
   
-  std::vector<DynamicType>& list = getList();
+  const std::vector<DynamicType>& list = getList();
   if(start > list.size() || end > list.size()) {
     throw std::runtime_error("Sublist indices out of range");
   }
   
+  if(start >= end) {
+    return DynamicType(std::vector<DynamicType>());
+  }
+  if(step == 1) {
+    return DynamicType(std::vector<DynamicType>(list.begin() + start, list.begin() + end));
+  }
+  
   std::vector<DynamicType> newList;
+  newList.reserve((end - start + step - 1) / step);
   for(size_t i = start; i < end; i += step) {
     newList.push_back(list[i]);
   }
   
-  return DynamicType(newList);
+  return DynamicType(std::move(newList));
 }
 
 void DynamicType::add(const DynamicType &item) {
@@ -531,9 +537,40 @@ void DynamicType::remove(const std::string &key) {
   dict.erase(key);
 }
 
+void DynamicType::removeAt(const DynamicType &index) {
+  if(type != Type::LIST) {
+    throw std::runtime_error("removeAt() can only be called on lists");
+  }
+  
+  std::vector<DynamicType>& list = getList();
+  long long i = index.toInt();
+  if(i < 0) {
+    i += static_cast<long long>(list.size());
+  }
+  if(i < 0 || static_cast<size_t>(i) >= list.size()) {
+    throw std::runtime_error("List index out of range");
+  }
+  
+  // Removing the last element (pop()) needs no shifting
+  if(static_cast<size_t>(i) + 1 == list.size()) {
+    list.pop_back();
+  } else {
+    list.erase(list.begin() + i);
+  }
+}
+
 void DynamicType::remove(const DynamicType &item) {
+  if(type == Type::LIST) {
+    std::vector<DynamicType>& list = getList();
+    auto it = std::find(list.begin(), list.end(), item);
+    if(it == list.end()) {
+      throw std::runtime_error("list.remove(x): x not in list");
+    }
+    list.erase(it);
+    return;
+  }
   if(type != Type::SET) {
-    throw std::runtime_error("remove() by item can only be called on sets");
+    throw std::runtime_error("remove() by item can only be called on lists and sets");
   }
   
   std::unordered_set<DynamicType>& set = getSet();
@@ -568,7 +605,8 @@ void DynamicType::set(const std::string &key, const DynamicType &value) {
   }
   
   std::map<std::string, DynamicType>& dict = getDict();
-  dict[key] = value;
+  // Constructs new entries from value directly instead of default-then-assign
+  dict.insert_or_assign(key, value);
 }
 
 DynamicType DynamicType::get(const std::string &key) const {
@@ -599,7 +637,7 @@ DynamicType DynamicType::keys() const {
     result.push_back(DynamicType(pair.first));
   }
   
-  return DynamicType(result);
+  return DynamicType(std::move(result));
 }
 
 DynamicType DynamicType::values() const {
@@ -614,7 +652,7 @@ DynamicType DynamicType::values() const {
     result.push_back(pair.second);
   }
   
-  return DynamicType(result);
+  return DynamicType(std::move(result));
 }
 
 DynamicType DynamicType::items() const {
@@ -631,8 +669,8 @@ DynamicType DynamicType::items() const {
         std::vector<DynamicType> item;
         item.push_back(DynamicType(pair.first));
         item.push_back(pair.second);
-        result.push_back(DynamicType(item));
+        result.push_back(DynamicType(std::move(item)));
     }
     
-    return DynamicType(result);
+    return DynamicType(std::move(result));
 }
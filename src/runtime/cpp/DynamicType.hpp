@@ -13,6 +13,7 @@
 #include <string>
 #include <sstream>
 #include <unordered_set>
+#include <utility>
 #include <vector>
 
 /**
@@ -87,9 +88,15 @@ class DynamicType{
 
     DynamicType(const std::vector<DynamicType> &val) : value(val), type(Type::LIST) {}
 
+    DynamicType(std::vector<DynamicType> &&val) : value(std::move(val)), type(Type::LIST) {}
+
     DynamicType(const std::map<std::string, DynamicType> &val) : value(val), type(Type::DICT) {}
 
+    DynamicType(std::map<std::string, DynamicType> &&val) : value(std::move(val)), type(Type::DICT) {}
+
     DynamicType(const std::unordered_set<DynamicType> &val) : value(val), type(Type::SET) {}
+
+    DynamicType(std::unordered_set<DynamicType> &&val) : value(std::move(val)), type(Type::SET) {}
     
     // Accept std::set but convert internally to unordered_set
     DynamicType(const std::set<DynamicType> &val) : value(std::unordered_set<DynamicType>(val.begin(), val.end())), type(Type::SET) {}
@@ -177,7 +184,7 @@ class DynamicType{
      * @return DynamicType containing the sublist
      * @throws std::runtime_error if not a list or indices are out of range
      */
-    DynamicType sublist(size_t start, size_t end);
+    DynamicType sublist(size_t start, size_t end) const;
     /**
      * Get a sublist from start to end (exclusive) with a step.
      * Python example: lst[2:10:2]
@@ -187,13 +194,13 @@ class DynamicType{
      * @return DynamicType containing the sublist
      * @throws std::runtime_error if not a list or indices are out of range
      */
-    DynamicType sublist(size_t start, size_t end, size_t step);
+    DynamicType sublist(size_t start, size_t end, size_t step) const;
     
     // DynamicType wrapper overloads for sublist
-    DynamicType sublist(const DynamicType& start, const DynamicType& end) {
+    DynamicType sublist(const DynamicType& start, const DynamicType& end) const {
       return sublist(static_cast<size_t>(start.toInt()), static_cast<size_t>(end.toInt()));
     }
-    DynamicType sublist(const DynamicType& start, const DynamicType& end, const DynamicType& step) {
+    DynamicType sublist(const DynamicType& start, const DynamicType& end, const DynamicType& step) const {
       return sublist(static_cast<size_t>(start.toInt()), static_cast<size_t>(end.toInt()), static_cast<size_t>(step.toInt()));
     }
 
@@ -230,13 +237,24 @@ class DynamicType{
     
     // List methods
     void removeAt(size_t index) { remove(index); }
-    void removeAt(const DynamicType &index) { remove(static_cast<size_t>(index.toInt())); }
+    /**
+     * Remove the element at a Python-style index; negative values count from the end.
+     * Python example: lst.pop() -> removeAt(DynamicType(-1))
+     * @param index Index to remove, -1 for the last element
+     * @throws std::runtime_error if not a list or index is out of range
+     */
+    void removeAt(const DynamicType &index);
     
     // Dict, List common methods  
     bool contains(const DynamicType& key) const;
     
     // Set operations
     void add(const DynamicType &item);
+    /**
+     * Remove an item from a set, or the first equal element from a list.
+     * Python example: s.remove(x) / lst.remove(x)
+     * @throws std::runtime_error if a list does not contain the item
+     */
     void remove(const DynamicType &item);
 };
 
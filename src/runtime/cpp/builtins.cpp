@@ -6,81 +6,46 @@
 
 // print() template implementation moved to builtins.hpp
 
-DynamicType len(const DynamicType &obj) {
-    if (obj.isList()) {
-      return DynamicType(static_cast<int>(obj.getList().size()));
-    }
-    if (obj.isDict()) {
-      return DynamicType(static_cast<int>(obj.getDict().size()));
-    }
-    if( obj.isSet()) {
-      return DynamicType(static_cast<int>(obj.getSet().size()));
-    }
-    if (obj.isString()) {
-      return DynamicType(static_cast<int>(obj.toString().length()));
-    }
-    throw std::runtime_error("len() not supported for this type");
-}
-
 DynamicType range(int stop) {
   std::vector<DynamicType> result;
+  result.reserve(stop > 0 ? static_cast<size_t>(stop) : 0);
   for (int i = 0; i < stop; ++i) {
     result.push_back(DynamicType(i));
   }
-  return DynamicType(result);
+  return DynamicType(std::move(result));
 }
 
 DynamicType range(int start, int stop) {
   std::vector<DynamicType> result;
+  result.reserve(stop > start ? static_cast<size_t>(static_cast<long long>(stop) - start) : 0);
   for (int i = start; i < stop; ++i) {
     result.push_back(DynamicType(i));
   }
-  return DynamicType(result);
+  return DynamicType(std::move(result));
 }
 
 DynamicType range(int start, int stop, int step) {
     std::vector<DynamicType> result;
     if (step > 0) {
+        if (stop > start) {
+            result.reserve(static_cast<size_t>(
+                (static_cast<long long>(stop) - start + step - 1) / step));
+        }
         for (int i = start; i < stop; i += step) {
             result.push_back(DynamicType(i));
         }
     } else if (step < 0) {
+        if (start > stop) {
+            result.reserve(static_cast<size_t>(
+                (static_cast<long long>(start) - stop - step - 1) / -static_cast<long long>(step)));
+        }
         for (int i = start; i > stop; i += step) {
             result.push_back(DynamicType(i));
         }
     } else {
         throw std::runtime_error("range() step argument must not be zero");
     }
-    return DynamicType(result);
-}
-
-// DynamicType overloads for range()
-DynamicType range(const DynamicType& stop) {
-    return range(stop.toInt());
-}
-
-DynamicType range(const DynamicType& start, const DynamicType& stop) {
-    return range(start.toInt(), stop.toInt());
-}
-
-DynamicType range(const DynamicType& start, const DynamicType& stop, const DynamicType& step) {
-    return range(start.toInt(), stop.toInt(), step.toInt());
-}
-
-DynamicType str(const DynamicType& value) {
-    return DynamicType(value.toString());
-}
-
-DynamicType int_(const DynamicType& value) {
-    return DynamicType(value.toInt());
-}
-
-DynamicType float_(const DynamicType& value) {
-    return DynamicType(value.toDouble());
-}
-
-DynamicType bool_(const DynamicType& value) {
-    return DynamicType(value.toBool());
+    return DynamicType(std::move(result));
 }
 
 DynamicType abs(const DynamicType& value) {
@@ -93,24 +58,33 @@ DynamicType abs(const DynamicType& value) {
     throw std::runtime_error("abs() requires numeric argument");
 }
 
-DynamicType min(const DynamicType& a, const DynamicType& b) {
-    return (a < b) ? a : b;
-}
-
-DynamicType max(const DynamicType& a, const DynamicType& b) {
-    return (a > b) ? a : b;
-}
-
 DynamicType sum(const DynamicType& iterable) {
     if (!iterable.isList()) {
         throw std::runtime_error("sum() requires a list");
     }
     
     const std::vector<DynamicType>& list = iterable.getList();
-    DynamicType result(0);
+    const size_t n = list.size();
+    size_t i = 0;
+    
+    // Numeric runs are accumulated natively instead of through DynamicType::operator+,
+    // following the same int -> double promotion the generic addition applies.
+    int intTotal = 0;
+    for (; i < n && list[i].isInt(); ++i) {
+        intTotal += list[i].toInt();
+    }
+    DynamicType result(intTotal);
+    if (i < n && list[i].isDouble()) {
+        double doubleTotal = intTotal;
+        for (; i < n && list[i].isNumeric(); ++i) {
+            doubleTotal += list[i].toDouble();
+        }
+        result = DynamicType(doubleTotal);
+    }
     
-    for (const DynamicType& item : list) {
-        result = result + item;
+    // Anything else (e.g. strings) goes through the generic addition
+    for (; i < n; ++i) {
+        result = result + list[i];
     }
     return result;
 }
@@ -160,7 +134,7 @@ DynamicType set(const DynamicType& iterable) {
         throw std::runtime_error("set() requires an iterable (list or set)");
     }
     
-    return DynamicType(result);
+    return DynamicType(std::move(result));
 }
 
 // Data structure helper functions
@@ -173,9 +147,7 @@ DynamicType sublist(const DynamicType& list, const DynamicType& start, const Dyn
     size_t startIdx = static_cast<size_t>(start.toInt());
     size_t endIdx = static_cast<size_t>(end.toInt());
     
-    // Create a non-const copy to call sublist
-    DynamicType listCopy = list;
-    return listCopy.sublist(startIdx, endIdx);
+    return list.sublist(startIdx, endIdx);
 }
 
 
@@ -5,6 +5,7 @@
 
 #include "DynamicType.hpp"
 #include <iostream>
+#include <stdexcept>
 
 // Python built-in functions
 
@@ -22,27 +23,61 @@ void print(const Args&... args) {
     }
 }
 
+// Small builtins are defined inline so calls in generated code can be inlined
+
 // len() - Get length of sequence
-DynamicType len(const DynamicType& value);
+inline DynamicType len(const DynamicType& obj) {
+    if (obj.isList()) {
+      return DynamicType(static_cast<int>(obj.getList().size()));
+    }
+    if (obj.isDict()) {
+      return DynamicType(static_cast<int>(obj.getDict().size()));
+    }
+    if (obj.isSet()) {
+      return DynamicType(static_cast<int>(obj.getSet().size()));
+    }
+    if (obj.isString()) {
+      return DynamicType(static_cast<int>(obj.toString().length()));
+    }
+    throw std::runtime_error("len() not supported for this type");
+}
 
 // range() - Generate sequence of integers
 DynamicType range(int stop);
 DynamicType range(int start, int stop);
 DynamicType range(int start, int stop, int step);
-DynamicType range(const DynamicType& stop);
-DynamicType range(const DynamicType& start, const DynamicType& stop);
-DynamicType range(const DynamicType& start, const DynamicType& stop, const DynamicType& step);
+inline DynamicType range(const DynamicType& stop) {
+    return range(stop.toInt());
+}
+inline DynamicType range(const DynamicType& start, const DynamicType& stop) {
+    return range(start.toInt(), stop.toInt());
+}
+inline DynamicType range(const DynamicType& start, const DynamicType& stop, const DynamicType& step) {
+    return range(start.toInt(), stop.toInt(), step.toInt());
+}
 
 // Type conversion functions
-DynamicType str(const DynamicType& value);
-DynamicType int_(const DynamicType& value);
-DynamicType float_(const DynamicType& value);
-DynamicType bool_(const DynamicType& value); 
+inline DynamicType str(const DynamicType& value) {
+    return DynamicType(value.toString());
+}
+inline DynamicType int_(const DynamicType& value) {
+    return DynamicType(value.toInt());
+}
+inline DynamicType float_(const DynamicType& value) {
+    return DynamicType(value.toDouble());
+}
+inline DynamicType bool_(const DynamicType& value) {
+    return DynamicType(value.toBool());
+}
 
 // Math functions
 DynamicType abs(const DynamicType& value);
-DynamicType min(const DynamicType& a, const DynamicType& b);
-DynamicType max(const DynamicType& a, const DynamicType& b);
+inline DynamicType min(const DynamicType& a, const DynamicType& b) {
+    return (a < b) ? a : b;
+}
+inline DynamicType max(const DynamicType& a, const DynamicType& b) {
+    return (a > b) ? a : b;
+}
 DynamicType sum(const DynamicType& iterable);
 
 // Utility functions
@@ -13,8 +13,8 @@ Tests validate the full code generation:
 
 import pytest
 from src.core import (
-    Module, FunctionDef, Identifier, LiteralExpr, BinaryExpr,
-    Assign, Return
+    Module, FunctionDef, Identifier, LiteralExpr, BinaryExpr, CallExpr,
+    Assign, ExprStmt, Return, Block, For, ListExpr, TupleExpr
 )
 from src.codegen.code_generator import CodeGenerator
 
@@ -90,6 +90,111 @@ class TestCodeGeneratorCppIntegration:
         assert "int main()" in code
         assert "DynamicType g = DynamicType(10);" in code
 
+    def test_generate_is_deterministic_across_calls(self):
+        """Test repeated generation reuses the same loop temporary names."""
+        loop = For(
+            target=Identifier(name="i"),
+            iterable=CallExpr(callee=Identifier(name="range"), args=[LiteralExpr(value=3)]),
+            body=Block(statements=[ExprStmt(value=Identifier(name="i"))]),
+        )
+        gen = CodeGenerator()
+        first = gen.generate(Module(body=[loop]))
+        second = gen.generate(Module(body=[loop]))
+
+        assert "__iter_temp_1" in first
+        assert first == second
+
+    def test_literal_collections_keep_value_types(self):
+        """Test repeated literal lists are reused without mixing up equal values."""
+        gen = CodeGenerator()
+
+        def emit(node):
+            return gen.data_structure_generator.visit(node)
+
+        ints = ListExpr(elements=[LiteralExpr(value=1), LiteralExpr(value=0)])
+        bools = ListExpr(elements=[LiteralExpr(value=True), LiteralExpr(value=False)])
+        floats = TupleExpr(elements=[LiteralExpr(value=1.0), LiteralExpr(value=-0.0)])
+
+        assert emit(ints) == "DynamicType(std::vector<DynamicType>{DynamicType(1), DynamicType(0)})"
+        assert emit(bools) == "DynamicType(std::vector<DynamicType>{DynamicType(true), DynamicType(false)})"
+        assert emit(floats) == "DynamicType(std::vector<DynamicType>{DynamicType(1.0), DynamicType(-0.0)})"
+        assert emit(ListExpr(elements=[LiteralExpr(value=1), LiteralExpr(value=0)])) == emit(ints)
+
+    def test_literal_cache_is_per_generator_and_module(self):
+        """Test remembered literals are not shared between generators or generations."""
+        numbers = ListExpr(elements=[LiteralExpr(value=i) for i in range(5)])
+        first, second = CodeGenerator(), CodeGenerator()
+
+        first.data_structure_generator.visit(numbers)
+        assert first.data_structure_generator._literal_cache
+        assert not second.data_structure_generator._literal_cache
+
+        first.generate(Module(body=[]))
+        assert not first.data_structure_generator._literal_cache
+
+    def test_deeply_nested_list_literal(self):
+        """Test nested list literals deeper than the recursion limit still generate."""
+        node = ListExpr(elements=[LiteralExpr(value=1)])
+        for _ in range(3000):
+            node = ListExpr(elements=[node, Identifier(name="x")])
+        gen = CodeGenerator()
+
+        code = gen.data_structure_generator.visit(node)
+
+        assert code.count("std::vector<DynamicType>") == 3001
+        assert code.startswith("DynamicType(std::vector<DynamicType>{DynamicType(std::vector")
+
+    def test_nested_literal_strings_are_kept_verbatim(self):
+        """Test string contents inside nested lists are never treated as generated code."""
+        # Private-use characters must pass through like any other string contents
+        for text in ("\ue0000\ue001", "\ue0001\ue001"):
+            node = ListExpr(elements=[
+                ListExpr(elements=[LiteralExpr(value=text)]),
+                ListExpr(elements=[LiteralExpr(value=1)]),
+            ])
+            module = Module(body=[Assign(target=Identifier(name="x"), value=node)])
+
+            code = CodeGenerator().generate(module)
+
+            assert f'DynamicType(std::string("{text}"))' in code
+            assert "DynamicType(std::vector<DynamicType>{DynamicType(1)})" in code
+
+    def test_collection_subclasses_use_base_visitor(self):
+        """Test subclasses of collection nodes are generated like their base class."""
+        class MyList(ListExpr):
+            pass
+
+        gen = CodeGenerator()
+        inner = MyList(elements=[LiteralExpr(value=1)])
+        outer = MyList(elements=[inner, Identifier(name="x")])
+
+        assert gen.expr_generator.visit(inner) == "DynamicType(std::vector<DynamicType>{DynamicType(1)})"
+        assert gen.expr_generator.visit(outer) == (
+            "DynamicType(std::vector<DynamicType>{"
+            "DynamicType(std::vector<DynamicType>{DynamicType(1)}), x})"
+        )
+
+    def test_generate_file_matches_generate(self, tmp_path):
+        """Test streaming a module to disk writes exactly what generate() returns."""
+        fn = FunctionDef(name="f", params=[], body=[Return(value=LiteralExpr(value=1))])
+        module = Module(body=[fn, ExprStmt(value=CallExpr(callee=Identifier(name="f"), args=[]))])
+        gen = CodeGenerator()
+        out = tmp_path / "out.cpp"
+
+        gen.generate_file(module, str(out))
+
+        assert out.read_text(encoding="utf-8") == gen.generate(module)
+
+    def test_generate_file_failure_leaves_no_output(self, tmp_path):
+        """Test a generation error does not leave a partially written file."""
+        module = Module(body=[LiteralExpr(value=1)])
+        out = tmp_path / "out.cpp"
+
+        with pytest.raises(NotImplementedError):
+            CodeGenerator().generate_file(module, str(out))
+
+        assert list(tmp_path.iterdir()) == []
+
 
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
@@ -13,7 +13,7 @@ Tests validate code generation for:
 
 import pytest
 from src.core import (
-    LiteralExpr, Identifier, UnaryExpr, BinaryExpr, CallExpr
+    LiteralExpr, Identifier, UnaryExpr, BinaryExpr, CallExpr, ListExpr
 )
 from src.codegen.expr_generator import ExprGenerator
 from src.codegen.scope_manager import ScopeManager
@@ -71,6 +71,13 @@ class TestExprGeneratorLiterals:
         code = self.gen.visit(expr)
         assert "DynamicType()" in code
 
+    def test_small_int_literals_do_not_alias_bool_or_float(self):
+        """Test values equal to small ints keep their own type."""
+        assert self.gen.visit(LiteralExpr(value=1)) == "DynamicType(1)"
+        assert self.gen.visit(LiteralExpr(value=True)) == "DynamicType(true)"
+        assert self.gen.visit(LiteralExpr(value=1.0)) == "DynamicType(1.0)"
+        assert self.gen.visit(LiteralExpr(value=100000)) == "DynamicType(100000)"
+
 
 # ============ ExprGenerator Identifier Tests ============
 
@@ -104,6 +111,31 @@ class TestExprGeneratorIdentifiers:
         code = self.gen.visit(expr)
         assert code == "undefined_var"
 
+    def test_identifier_subclass_uses_base_visitor(self):
+        """Subclasses of supported nodes dispatch to their base class visitor."""
+        class TypedIdentifier(Identifier):
+            pass
+
+        assert self.gen.visit(TypedIdentifier(name="x")) == "x"
+
+    def test_unsupported_node_raises(self):
+        """Nodes without a visitor raise NotImplementedError."""
+        with pytest.raises(NotImplementedError):
+            self.gen.visit(ScopeManager())
+
+    def test_collections_follow_data_structure_generator(self):
+        """Collections go to the bound DataStructureGenerator, if any."""
+        class StubGenerator:
+            def visit(self, node):
+                return "stub"
+
+        node = ListExpr(elements=[Identifier(name="x")])
+        self.gen.data_structure_generator = StubGenerator()
+        assert self.gen.visit(node) == "stub"
+
+        self.gen.data_structure_generator = None
+        assert self.gen.visit(node) == "DynamicType(std::vector<DynamicType>{x})"
+
 
 # ============ ExprGenerator Unary Op Tests ============
 
@@ -207,6 +239,40 @@ class TestExprGeneratorBinaryOps:
         # Logical operators now wrap with toBool() conversions
         assert "toBool()" in code and "||" in code
 
+    def test_binary_left_nested_chain(self):
+        """Test left-nested chains keep Python's left-to-right grouping."""
+        expr = BinaryExpr(
+            left=BinaryExpr(left=Identifier(name="a"), op="+", right=Identifier(name="b")),
+            op="*",
+            right=Identifier(name="a"),
+        )
+        code = self.gen.visit(expr)
+        assert code == "((a) + (b)) * (a)"
+
+    def test_binary_long_chain_does_not_recurse(self):
+        """Test very long operator chains stay below the recursion limit."""
+        expr = Identifier(name="a")
+        for _ in range(5000):
+            expr = BinaryExpr(left=expr, op="+", right=Identifier(name="b"))
+        code = self.gen.visit(expr)
+        assert code.count("(b)") == 5000
+
+    def test_binary_right_nested_chain(self):
+        """Test right-nested operands keep their grouping, however deep."""
+        expr = BinaryExpr(
+            left=Identifier(name="a"),
+            op="-",
+            right=BinaryExpr(left=Identifier(name="b"), op="**", right=Identifier(name="c")),
+        )
+        assert self.gen.visit(expr) == "(a) - (DynamicType(pow(b.toDouble(), c.toDouble())))"
+
+        deep = Identifier(name="b")
+        for _ in range(5000):
+            deep = BinaryExpr(left=Identifier(name="a"), op="*", right=deep)
+        code = self.gen.visit(deep)
+        assert code.count("(a) * (") == 5000
+        assert code.endswith("(a) * (b)" + ")" * 4999)
+
 
 # ============ ExprGenerator Call Expression Tests ============
 
@@ -101,6 +101,20 @@ class TestFunctionGeneratorBasic:
         # Scope should be back to initial state after function generation
         assert initial_scope_count == final_scope_count
 
+    def test_function_param_assignment_not_redeclared(self):
+        """Test that assigning to a parameter reuses it instead of redeclaring."""
+        fn = FunctionDef(
+            name="bump",
+            params=[Identifier(name="x")],
+            body=[
+                Assign(target=Identifier(name="x"), value=LiteralExpr(value=1))
+            ]
+        )
+        code = self.gen.visit(fn)
+        assert "x = DynamicType(1);" in code
+        assert "DynamicType x = DynamicType(1);" not in code
+        assert not self.scope.exists("x")
+
     def test_function_complex(self):
         """Test complex function with multiple statements."""
         fn = FunctionDef(
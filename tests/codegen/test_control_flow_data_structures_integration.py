@@ -440,6 +440,30 @@ test_strings()
         
         os.remove(cpp_file)
 
+    def test_list_pop_and_remove(self, transpiler, runtime_path):
+        """Test list.pop() drops the last element and list.remove(x) the first match."""
+        program = '''
+def test_list_removal():
+    items = [1, 2, 3, 2]
+    items.pop()
+    print("After pop:", len(items), items[2])
+    
+    items.remove(2)
+    print("After remove:", len(items), items[0], items[1])
+
+test_list_removal()
+'''
+        cpp_file = transpiler.transpile(program, "test_list_removal.cpp")
+        stdout, stderr, retcode = self.compile_and_run(cpp_file, runtime_path)
+        
+        assert retcode == 0, f"List removal test failed: {stderr}"
+        
+        lines = stdout.strip().split('\n')
+        assert "After pop: 3 3" in lines[0]
+        assert "After remove: 2 1 3" in lines[1]
+        
+        os.remove(cpp_file)
+
 
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
\ No newline at end of file
@@ -186,6 +186,116 @@ for i in range(3):
         
         os.remove(cpp_file)
     
+    def test_for_loop_over_list_execution(self, transpiler, runtime_path):
+        """Test iterating a list in place and iterating one that is mutated."""
+        source = """
+numbers = [1, 2, 3]
+total = 0
+for n in numbers:
+    total += n
+print(total)
+
+for n in numbers:
+    numbers.append(n * 10)
+print(len(numbers))
+"""
+        
+        cpp_file = transpiler.transpile(source, "test_e2e_for_list.cpp")
+        stdout, stderr, retcode = self.compile_and_run(cpp_file, runtime_path)
+        
+        assert retcode == 0, f"Execution failed: {stderr}"
+        lines = stdout.strip().split('\n')
+        assert "6" in lines[0]
+        assert "6" in lines[1]
+        
+        os.remove(cpp_file)
+    
+    def test_long_list_literal_execution(self, transpiler, runtime_path):
+        """Test long list literals built element by element keep order and values."""
+        values = ", ".join(str(i) for i in range(1, 21))
+        source = f"""
+offset = 100
+numbers = [{values}, offset]
+print(len(numbers))
+print(numbers[0], numbers[19], numbers[20])
+total = 0
+for n in [{values}]:
+    total += n
+print(total)
+"""
+        
+        cpp_file = transpiler.transpile(source, "test_e2e_long_list.cpp")
+        stdout, stderr, retcode = self.compile_and_run(cpp_file, runtime_path)
+        
+        assert retcode == 0, f"Execution failed: {stderr}"
+        lines = stdout.strip().split('\n')
+        assert lines[0] == "21"
+        assert lines[1] == "1 20 100"
+        assert lines[2] == "210"
+        
+        os.remove(cpp_file)
+    
+    def test_dict_literal_keys_execution(self, transpiler, runtime_path):
+        """Test literal string and int dict keys match runtime lookups."""
+        source = """
+key = "b"
+d = {"a": 1, 2: "two", key: 3, "say \\"hi\\"": 4}
+print(d.get("a"), d.get(2), d.get("b"), d.get("say \\"hi\\""))
+"""
+        
+        cpp_file = transpiler.transpile(source, "test_e2e_dict_keys.cpp")
+        with open(cpp_file) as f:
+            generated = f.read()
+        assert '{"a", DynamicType(1)}' in generated
+        assert '{"2", ' in generated
+        assert "(key).toString()" in generated
+        
+        stdout, stderr, retcode = self.compile_and_run(cpp_file, runtime_path)
+        
+        assert retcode == 0, f"Execution failed: {stderr}"
+        assert stdout.strip() == "1 two 3 4"
+        
+        os.remove(cpp_file)
+    
+    def test_sum_builtin_execution(self, transpiler, runtime_path):
+        """Test sum() over int lists, mixed int/float lists and empty lists."""
+        source = """
+print(sum([1, 2, 3, 4]))
+print(sum([1, 2.5, 3]))
+print(sum([]))
+"""
+        
+        cpp_file = transpiler.transpile(source, "test_e2e_sum.cpp")
+        stdout, stderr, retcode = self.compile_and_run(cpp_file, runtime_path)
+        
+        assert retcode == 0, f"Execution failed: {stderr}"
+        lines = stdout.strip().split('\n')
+        assert lines[0] == "10"
+        assert float(lines[1]) == 6.5
+        assert lines[2] == "0"
+        
+        os.remove(cpp_file)
+    
+    def test_open_ended_slice_of_expression_execution(self, transpiler, runtime_path):
+        """Test open-ended slices of non-identifier objects evaluate them once."""
+        source = """
+rows = [[1, 2, 3, 4]]
+print(sum(rows[0][1:]))
+print(sum([1, 2, 3, 4][::2]))
+"""
+
+        cpp_file = transpiler.transpile(source, "test_e2e_slice_expr.cpp")
+        with open(cpp_file, 'r') as f:
+            assert "__slice_obj" in f.read()
+        stdout, stderr, retcode = self.compile_and_run(cpp_file, runtime_path)
+
+        assert retcode == 0, f"Execution failed: {stderr}"
+        lines = stdout.strip().split('\n')
+        assert lines[0] == "9"
+        assert lines[1] == "4"
+
+        os.remove(cpp_file)
+
     def test_function_with_multiple_params(self, transpiler, runtime_path):
         """Test function with multiple parameters."""
         source = """
@@ -149,6 +149,22 @@ else:
         assert "if" in generated
         assert "else" in generated
         assert generated.count("else") >= 2  # else if and else
+        assert "} else if (" in generated
+        assert "} else {" in generated
+        
+        os.remove(cpp_code)
+    
+    def test_long_elif_chain(self):
+        """Test every branch of a long elif chain is emitted once, in order."""
+        branches = "".join(f"elif x == {i}:\n    print({i})\n" for i in range(1, 40))
+        source = "x = 5\nif x == 0:\n    print(0)\n" + branches + "else:\n    print(-1)\n"
+        cpp_code = self.transpiler.transpile(source, "temp_test.cpp")
+        with open(cpp_code, 'r') as f:
+            generated = f.read()
+        
+        assert generated.count("} else if (") == 39
+        assert generated.count("} else {") == 1
+        assert generated.index("print(DynamicType(1))") < generated.index("print(DynamicType(39))")
         
         os.remove(cpp_code)
     
@@ -200,6 +216,56 @@ for i in range(10):
         
         os.remove(cpp_code)
     
+    def test_for_loop_read_only_iterates_in_place(self):
+        """Test a list the body never mutates is not copied before the loop."""
+        source = """
+numbers = [1, 2, 3]
+for n in numbers:
+    print(n)
+"""
+        cpp_code = self.transpiler.transpile(source, "temp_test.cpp")
+        with open(cpp_code, 'r') as f:
+            generated = f.read()
+        
+        assert "const auto& __iter_temp_1 = (numbers).getList();" in generated
+        assert "for (auto n :" in generated
+        
+        os.remove(cpp_code)
+    
+    def test_for_loop_mutating_body_keeps_copy(self):
+        """Test a list mutated inside the body is still iterated over a copy."""
+        source = """
+numbers = [1, 2, 3]
+for n in numbers:
+    numbers.append(n)
+"""
+        cpp_code = self.transpiler.transpile(source, "temp_test.cpp")
+        with open(cpp_code, 'r') as f:
+            generated = f.read()
+        
+        assert "auto __iter_temp_1 = (numbers).getList();" in generated
+        assert "const auto&" not in generated
+
+        os.remove(cpp_code)
+
+    def test_nested_for_loop_mutation_seen_by_outer_loop(self):
+        """Test a mutation in an inner loop body still makes the outer loop copy."""
+        source = """
+numbers = [1, 2, 3]
+extra = [4]
+for n in numbers:
+    for e in extra:
+        numbers.append(e)
+"""
+        cpp_code = self.transpiler.transpile(source, "temp_test.cpp")
+        with open(cpp_code, 'r') as f:
+            generated = f.read()
+
+        assert "auto __iter_temp_1 = (numbers).getList();" in generated
+        assert "const auto& __iter_temp_2 = (extra).getList();" in generated
+
+        os.remove(cpp_code)
+
     def test_nested_control_structures(self):
         """Test nested if and loops."""
         source = """